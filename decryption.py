@@ -1,5 +1,6 @@
 # decryption.py
 import getpass
+import struct
 from colors import print_colored, Colors
 from crypto import decrypt_password_aes_gcm
 from file_utils import create_file_chooser, read_binary_file
@@ -10,30 +11,30 @@ from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 # Share wrapper metadata (must match encryption)
 SHARE_MAGIC = b"FKSS01"
 SHARE_MAGIC_LEN = len(SHARE_MAGIC)
+# version | index | total | threshold | share_len | packaged_cipher_len
+_SHARE_HDR_NO_MAGIC = struct.Struct(">BBBBII")
 
 def _parse_share_payload(payload: bytes):
     """
     Parse wrapped share payload:
     SHARE_MAGIC (6) | version (1) | index (1) | total (1) | threshold (1)
       | share_len (4) | packaged_cipher_len (4) | share_bytes | packaged_cipher_bytes
-    Returns dict with fields.
+    Returns dict with fields; share_bytes / packaged_cipher are views into payload.
     """
-    min_header = SHARE_MAGIC_LEN + 1 + 1 + 1 + 1 + 4 + 4
+    min_header = SHARE_MAGIC_LEN + _SHARE_HDR_NO_MAGIC.size
     if len(payload) < min_header:
         raise ValueError("Share payload too short / malformed")
     if payload[:SHARE_MAGIC_LEN] != SHARE_MAGIC:
         raise ValueError("Share magic mismatch")
-    pos = SHARE_MAGIC_LEN
-    version = payload[pos]; pos += 1
-    index = payload[pos]; pos += 1
-    total = payload[pos]; pos += 1
-    threshold = payload[pos]; pos += 1
-    share_len = int.from_bytes(payload[pos:pos+4], 'big'); pos += 4
-    packaged_cipher_len = int.from_bytes(payload[pos:pos+4], 'big'); pos += 4
-    if pos + share_len + packaged_cipher_len > len(payload):
+    version, index, total, threshold, share_len, packaged_cipher_len = _SHARE_HDR_NO_MAGIC.unpack_from(payload, SHARE_MAGIC_LEN)
+    # One bounds check against the final end offset covers both sections
+    share_end = min_header + share_len
+    end = share_end + packaged_cipher_len
+    if end > len(payload):
         raise ValueError("Declared sizes exceed payload size")
-    share_bytes = payload[pos:pos+share_len]; pos += share_len
-    packaged_cipher = payload[pos:pos+packaged_cipher_len]
+    view = memoryview(payload)
+    share_bytes = view[min_header:share_end]
+    packaged_cipher = view[share_end:end]
     return {
         "version": version,
         "index": index,
@@ -104,7 +105,7 @@ def decryption_mode():
         return
 
     # Build share list for recovery (raw share bytes as produced by sss.split)
-    share_bytes_list = [s['share_bytes'] for s in parsed_shares[:threshold]]
+    share_bytes_list = [bytes(s['share_bytes']) for s in parsed_shares[:threshold]]
     packaged_cipher = parsed_shares[0]['packaged_cipher']
 
     try:
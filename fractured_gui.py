@@ -6,22 +6,39 @@ Blue theme with glassmorphism, smooth animations, and premium typography.
 """
 
 import customtkinter as ctk
-from tkinter import filedialog, messagebox, Canvas
+from tkinter import filedialog, messagebox, Canvas, Frame, TclError
 import threading
+import queue
+from concurrent.futures import ThreadPoolExecutor
 import os
 import sys
 import subprocess
 import platform
 import shutil
-from PIL import Image, ImageDraw, ImageFilter
+import struct
+import mmap
+from functools import lru_cache
+from PIL import Image
 import time
+import weakref
+from datetime import datetime
 
 # Add current directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+_HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, _HERE)
 
 from steganography import embed_data_into_image, extract_data_from_image
 from sss import split_bytes_into_shares, recover_bytes_from_shares
 from crypto import encrypt_password_aes_gcm, decrypt_password_aes_gcm
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+# Share wrapper header: magic | version | index | total | threshold | share_len | packaged_cipher_len
+_SHARE_HDR = struct.Struct(">6sBBBBII")
+# Manual-decrypt .bin files above this size are memory-mapped rather than read
+_MMAP_THRESHOLD = 64 * 1024
+# Default folders for the file dialogs, resolved once
+_PICTURES = os.path.expanduser("~/Pictures")
+_DOWNLOADS = os.path.expanduser("~/Downloads")
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # COLOR SCHEME - Attractive light blue (sky / cyan) theme
@@ -93,13 +110,18 @@ class Colors:
 # Fallback to system defaults if not available
 import tkinter.font as tkfont
 
+@lru_cache(maxsize=None)
+def _available_font_families():
+    """Installed font families, queried from Tk once and shared by the font pickers."""
+    return frozenset(tkfont.families())
+
 def get_available_font():
     """Get the first available attractive font"""
     preferred_fonts = ["Inter", "Poppins", "Roboto", "Segoe UI", "system-ui"]
     
     # Get all available fonts
     try:
-        available_fonts = list(tkfont.families())
+        available_fonts = _available_font_families()
         for font in preferred_fonts:
             if font in available_fonts:
                 return font
@@ -115,7 +137,7 @@ def get_available_emoji_font():
     """Pick an emoji-capable font (Linux friendly)."""
     preferred = ["Noto Color Emoji", "Segoe UI Emoji", "Apple Color Emoji", "Twitter Color Emoji"]
     try:
-        available = set(tkfont.families())
+        available = _available_font_families()
         for f in preferred:
             if f in available:
                 return f
@@ -123,7 +145,19 @@ def get_available_emoji_font():
         pass
     return _FONT_FAMILY
 
-_EMOJI_FONT = get_available_emoji_font()
+class _EmojiFont:
+    """
+    Font tuple that resolves the emoji family on first use.
+    Icons are drawn as images, so most runs never touch an emoji font at all.
+    """
+    def __init__(self, size):
+        self.size = size
+        self.font = None
+
+    def __get__(self, instance, owner):
+        if self.font is None:
+            self.font = (get_available_emoji_font(), self.size)
+        return self.font
 
 class Fonts:
     FAMILY = _FONT_FAMILY
@@ -150,14 +184,68 @@ class Fonts:
     CAPTION = (FAMILY, 11)
     TAGLINE = (FAMILY, 17)
 
-    EMOJI_LG = (_EMOJI_FONT, 30)
-    EMOJI_MD = (_EMOJI_FONT, 22)
-    EMOJI_SM = (_EMOJI_FONT, 20)
+    EMOJI_LG = _EmojiFont(30)
+    EMOJI_MD = _EmojiFont(22)
+    EMOJI_SM = _EmojiFont(20)
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # FILE DIALOG HELPERS - Native Linux file manager integration
 # ═══════════════════════════════════════════════════════════════════════════════
 
+# Resolve the Linux dialog helpers once instead of scanning PATH on every dialog
+_ZENITY = shutil.which("zenity")
+_KDIALOG = shutil.which("kdialog")
+
+# Held while an external helper dialog is open, so a second request cannot start another one
+_DIALOG_LOCK = threading.Lock()
+
+def _run_dialog_helper(cmd, parent_window):
+    """
+    Run an external file-dialog helper and return (returncode, stdout).
+    When called on the Tk thread, keep pumping Tk events while the helper is open
+    so the window keeps repainting (animations, resize) instead of freezing; a grab
+    on a hidden widget keeps the dialog modal by swallowing clicks and keys meanwhile.
+    """
+    on_tk_thread = threading.current_thread() is threading.main_thread()
+    # Tk thread: a re-entrant request is ignored (reported as cancelled);
+    # worker threads simply wait their turn
+    if not _DIALOG_LOCK.acquire(blocking=not on_tk_thread):
+        return 1, ""
+    try:
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+        if not on_tk_thread:
+            out, _ = proc.communicate()
+            return proc.returncode, out
+
+        blocker = None
+        try:
+            blocker = Frame(parent_window, width=1, height=1, bg=Colors.BG_DARK)
+            blocker.place(x=0, y=0)
+            blocker.update_idletasks()
+            blocker.grab_set()
+        except TclError:
+            pass  # window not viewable: nothing to click anyway
+        try:
+            while proc.poll() is None:
+                parent_window.update()
+                time.sleep(0.02)
+        except TclError:
+            # Main window went away under the dialog: don't wait on the helper
+            proc.kill()
+            proc.wait()
+            return 1, ""
+        finally:
+            if blocker is not None:
+                try:
+                    blocker.grab_release()
+                    blocker.destroy()
+                except TclError:
+                    pass
+        out, _ = proc.communicate()
+        return proc.returncode, out
+    finally:
+        _DIALOG_LOCK.release()
+
 def native_file_dialog(parent_window, title, filetypes, mode="open", initialdir=None, defaultextension=""):
     """
     Open native file dialog that integrates with Linux file managers.
@@ -170,17 +258,17 @@ def native_file_dialog(parent_window, title, filetypes, mode="open", initialdir=
     # Falls back to tkinter dialogs if helpers are not available.
     if platform.system() == "Linux":
         # GNOME / common
-        if shutil.which("zenity"):
+        if _ZENITY:
             try:
-                cmd = ["zenity", "--file-selection", "--title", title]
+                cmd = [_ZENITY, "--file-selection", "--title", title]
                 if mode == "save":
                     cmd += ["--save", "--confirm-overwrite"]
                 if initialdir:
                     # zenity expects a trailing slash for directory
                     cmd += ["--filename", os.path.join(initialdir, "")]
-                res = subprocess.run(cmd, capture_output=True, text=True)
-                if res.returncode == 0:
-                    path = res.stdout.strip()
+                returncode, stdout = _run_dialog_helper(cmd, parent_window)
+                if returncode == 0:
+                    path = stdout.strip()
                     if mode == "save" and defaultextension and path and not os.path.splitext(path)[1]:
                         path += defaultextension
                     return path
@@ -189,15 +277,15 @@ def native_file_dialog(parent_window, title, filetypes, mode="open", initialdir=
                 pass
 
         # KDE
-        if shutil.which("kdialog"):
+        if _KDIALOG:
             try:
                 if mode == "save":
-                    cmd = ["kdialog", "--getsavefilename", os.path.join(initialdir, ""), "*"]
+                    cmd = [_KDIALOG, "--getsavefilename", os.path.join(initialdir, ""), "*"]
                 else:
-                    cmd = ["kdialog", "--getopenfilename", os.path.join(initialdir, ""), "*"]
-                res = subprocess.run(cmd, capture_output=True, text=True)
-                if res.returncode == 0:
-                    path = res.stdout.strip()
+                    cmd = [_KDIALOG, "--getopenfilename", os.path.join(initialdir, ""), "*"]
+                returncode, stdout = _run_dialog_helper(cmd, parent_window)
+                if returncode == 0:
+                    path = stdout.strip()
                     if mode == "save" and defaultextension and path and not os.path.splitext(path)[1]:
                         path += defaultextension
                     return path
@@ -235,7 +323,34 @@ def native_file_dialog(parent_window, title, filetypes, mode="open", initialdir=
 # CUSTOM WIDGETS - Glassmorphism, neumorphism, micro-interactions
 # ═══════════════════════════════════════════════════════════════════════════════
 
-_SMOOTH_SCROLL_JOBS = {}
+# Tcl side of smooth_scroll: the whole animation runs inside the Tcl event loop,
+# one `after` per step, without calling back into Python. The pending job id per
+# canvas lives in the Tcl array fk_smoothjob so a new wheel event can cancel it.
+_SMOOTH_SCROLL_TCL = """
+proc ::fk_smoothscroll {w n step acc delay} {
+    global fk_smoothjob
+    if {$n <= 0 || ![winfo exists $w]} {
+        unset -nocomplain fk_smoothjob($w)
+        return
+    }
+    set acc [expr {$acc + $step}]
+    set move [expr {int($acc)}]
+    set acc [expr {$acc - $move}]
+    if {$move != 0 && [catch {$w yview scroll $move units}]} {
+        unset -nocomplain fk_smoothjob($w)
+        return
+    }
+    set fk_smoothjob($w) [after $delay [list ::fk_smoothscroll $w [expr {$n - 1}] $step $acc $delay]]
+}
+proc ::fk_smoothscroll_start {w n step delay} {
+    global fk_smoothjob
+    if {[info exists fk_smoothjob($w)]} {
+        after cancel $fk_smoothjob($w)
+        unset fk_smoothjob($w)
+    }
+    ::fk_smoothscroll $w $n $step 0.0 $delay
+}
+"""
 
 def smooth_scroll(canvas, delta_units, *, steps=12, delay_ms=8):
     """
@@ -245,55 +360,39 @@ def smooth_scroll(canvas, delta_units, *, steps=12, delay_ms=8):
     if not canvas:
         return
 
-    # Cancel any previous smooth scroll for this canvas
-    key = str(canvas)
-    job = _SMOOTH_SCROLL_JOBS.get(key)
-    if job is not None:
-        try:
-            canvas.after_cancel(job)
-        except Exception:
-            pass
-        _SMOOTH_SCROLL_JOBS.pop(key, None)
-
-    # Use an accumulator so small deltas still move (no int(0) problem)
-    total = float(delta_units)
-    per_step = total / float(max(1, steps))
-    acc = 0.0
-    step = 0
-
-    def _tick():
-        nonlocal acc, step
-        if step >= steps:
-            _SMOOTH_SCROLL_JOBS.pop(key, None)
-            return
-        step += 1
-
-        acc += per_step
-        move = int(acc)
-        acc -= move
+    # Readiness is remembered on the canvas itself (no module-level registry to leak)
+    if not getattr(canvas, "_smooth_scroll_ready", False):
+        if not canvas.tk.call("info", "procs", "::fk_smoothscroll_start"):
+            canvas.tk.eval(_SMOOTH_SCROLL_TCL)
+        canvas._smooth_scroll_ready = True
 
-        try:
-            if move != 0:
-                canvas.yview_scroll(move, "units")
-        except Exception:
-            _SMOOTH_SCROLL_JOBS.pop(key, None)
-            return
+    # The Tcl proc keeps an accumulator so small deltas still move (no int(0) problem)
+    steps = max(1, steps)
+    per_step = float(delta_units) / float(steps)
+    try:
+        canvas.tk.call("::fk_smoothscroll_start", canvas._w, steps, per_step, delay_ms)
+    except Exception:
+        pass
 
-        _SMOOTH_SCROLL_JOBS[key] = canvas.after(delay_ms, _tick)
+# Scroll units for the common notched-wheel deltas (Windows/Mac send multiples of 120)
+_WHEEL_LUT = {d: -1 * (d / 120.0) * 6.0 for d in (-360, -240, -120, 120, 240, 360)}
 
-    _tick()
+# Scroll frames registered via enable_touchpad_scrolling (entries vanish with the widget)
+_SCROLL_TARGETS = weakref.WeakSet()
 
 def enable_touchpad_scrolling(scrollable_frame):
     """
-    Kept for backward compatibility.
-    Scrolling is handled globally (under-cursor routing) inside the app via `_setup_global_scrolling()`.
+    Register a scroll frame (anything with `_parent_canvas`) as a wheel target.
+    Scrolling is handled globally (under-cursor routing) inside the app via `_setup_global_scrolling()`,
+    which installs the only bind_all handlers; registration just lets it find targets without Tcl queries.
     """
-    return
+    _SCROLL_TARGETS.add(scrollable_frame)
+
 
 class PixelatedCard(ctk.CTkFrame):
-    """Card with pixelated/notched border style - Linux retro aesthetic"""
+    """Sharp-cornered card drawn with CTkFrame's own flat border - Linux retro aesthetic"""
     def __init__(self, master, **kwargs):
-        # Remove corner_radius to create sharp corners for pixelated effect
+        # Corners are always square; a caller's corner_radius is ignored
         kwargs.pop('corner_radius', None)
         border_width = kwargs.pop('border_width', 2)
         border_color = kwargs.pop('border_color', Colors.BORDER_LIGHT)
@@ -301,108 +400,11 @@ class PixelatedCard(ctk.CTkFrame):
         super().__init__(
             master,
             fg_color=Colors.BG_MEDIUM,
-            corner_radius=0,  # Sharp corners for pixelated look
+            corner_radius=0,  # Square corners
             border_width=border_width,
             border_color=border_color,
             **kwargs
         )
-        
-        # Store border properties
-        self._notch_size = 8  # Size of the L-shaped notch at corners
-        self._border_color = border_color
-        self._hover_color = Colors.BLUE_NEON
-        self._is_hovered = False
-        
-        # Create a wrapper frame with canvas overlay for custom border
-        self._border_overlay = None
-        
-        self.bind("<Enter>", self._on_enter)
-        self.bind("<Leave>", self._on_leave)
-        self.bind("<Configure>", self._on_configure)
-        
-        # Draw border after widget is placed
-        self.after_idle(self._draw_border)
-    
-    def _on_configure(self, event=None):
-        """Redraw border when widget is resized"""
-        if event and event.widget == self:
-            self.after_idle(self._draw_border)
-    
-    def _draw_border(self):
-        """Draw pixelated border with notched corners using canvas overlay"""
-        try:
-            width = self.winfo_width()
-            height = self.winfo_height()
-            
-            if width <= 1 or height <= 1:
-                # Schedule retry
-                self.after(50, self._draw_border)
-                return
-            
-            # Remove old border overlay if exists
-            if self._border_overlay:
-                try:
-                    self._border_overlay.destroy()
-                except:
-                    pass
-            
-            # Create canvas overlay for custom border
-            self._border_overlay = Canvas(
-                self,
-                highlightthickness=0,
-                bg="",  # Transparent
-                width=width,
-                height=height,
-                cursor=""
-            )
-            self._border_overlay.place(x=0, y=0)
-            # Make canvas non-interactive (pass events through)
-            self._border_overlay.bind("<Button-1>", lambda e: self.focus_set())
-            self._border_overlay.lower()  # Place behind content
-            
-            notch = self._notch_size
-            color = self._hover_color if self._is_hovered else self._border_color
-            
-            # Draw border with notched corners (pixelated style)
-            # Top edge (with gaps for notches)
-            self._border_overlay.create_line(notch, 1, width - notch, 1, fill=color, width=2)
-            # Right edge
-            self._border_overlay.create_line(width - 1, notch, width - 1, height - notch, fill=color, width=2)
-            # Bottom edge
-            self._border_overlay.create_line(width - notch, height - 1, notch, height - 1, fill=color, width=2)
-            # Left edge
-            self._border_overlay.create_line(1, height - notch, 1, notch, fill=color, width=2)
-            
-            # Draw L-shaped notches at corners (creating the pixelated cut-out effect)
-            # Top-left corner (L pointing inward/down-right)
-            self._border_overlay.create_line(1, notch, notch, notch, fill=color, width=2)
-            self._border_overlay.create_line(notch, 1, notch, notch, fill=color, width=2)
-            
-            # Top-right corner (L pointing inward/down-left)
-            self._border_overlay.create_line(width - notch, 1, width - notch, notch, fill=color, width=2)
-            self._border_overlay.create_line(width - notch, notch, width - 1, notch, fill=color, width=2)
-            
-            # Bottom-right corner (L pointing inward/up-left)
-            self._border_overlay.create_line(width - notch, height - notch, width - 1, height - notch, fill=color, width=2)
-            self._border_overlay.create_line(width - notch, height - notch, width - notch, height - 1, fill=color, width=2)
-            
-            # Bottom-left corner (L pointing inward/up-right)
-            self._border_overlay.create_line(1, height - notch, notch, height - notch, fill=color, width=2)
-            self._border_overlay.create_line(notch, height - notch, notch, height - 1, fill=color, width=2)
-            
-        except Exception as e:
-            # Silently fail and retry later
-            self.after(100, self._draw_border)
-    
-    def _on_enter(self, event):
-        """Handle hover enter"""
-        self._is_hovered = True
-        self._draw_border()
-    
-    def _on_leave(self, event):
-        """Handle hover leave"""
-        self._is_hovered = False
-        self._draw_border()
 
 
 # Keep GlowingCard as alias for backward compatibility, but use PixelatedCard
@@ -548,12 +550,15 @@ class AnimatedProgress(ctk.CTkProgressBar):
             if not self._animating:
                 return
             # Fill left→right then reset (simple, predictable)
-            self._phase = (self._phase + 0.02) % 1.0
+            self._phase = (self._phase + 0.04) % 1.0
             try:
-                self.set(self._phase)
+                # Skip the canvas redraw while the bar is off-screen (e.g. another tab is shown)
+                if self.winfo_viewable():
+                    self.set(self._phase)
             except Exception:
                 pass
-            self._anim_job = self.after(16, tick)  # ~60fps
+            # ~30fps is plenty for a progress sweep and halves the canvas redraws
+            self._anim_job = self.after(33, tick)
 
         tick()
 
@@ -569,11 +574,129 @@ class AnimatedProgress(ctk.CTkProgressBar):
         self.set(0)
 
 
+class LeanScrollFrame(Frame):
+    """
+    Vertical scroll pane: one Canvas + one inner Frame + scrollbar.
+    Drop-in for CTkScrollableFrame in the tabs (children pack into it, pack()/grid()
+    place the outer frame). Wheel events are routed by the app's global handlers via
+    _parent_canvas, so no per-instance bind_all handlers are installed.
+    """
+    def __init__(self, master, fg_color="transparent", scrollbar_button_color=None,
+                 scrollbar_button_hover_color=None):
+        if fg_color == "transparent":
+            fg_color = master.cget("fg_color")
+        self._parent_frame = Frame(master, bg=fg_color, highlightthickness=0)
+        self._parent_canvas = Canvas(
+            self._parent_frame, bg=fg_color, highlightthickness=0, width=200, height=200
+        )
+        # Same scroll unit sizes as CTkScrollableFrame, so smooth_scroll speed is unchanged
+        if sys.platform.startswith("win"):
+            self._parent_canvas.configure(yscrollincrement=1)
+        elif sys.platform == "darwin":
+            self._parent_canvas.configure(yscrollincrement=8)
+        else:
+            self._parent_canvas.configure(yscrollincrement=30)
+        self._scrollbar = ctk.CTkScrollbar(
+            self._parent_frame,
+            orientation="vertical",
+            command=self._parent_canvas.yview,
+            button_color=scrollbar_button_color,
+            button_hover_color=scrollbar_button_hover_color
+        )
+        self._parent_canvas.configure(yscrollcommand=self._scrollbar.set)
+        self._parent_frame.grid_columnconfigure(0, weight=1)
+        self._parent_frame.grid_rowconfigure(0, weight=1)
+        self._parent_canvas.grid(row=0, column=0, sticky="nsew")
+        self._scrollbar.grid(row=0, column=1, sticky="ns")
+
+        super().__init__(self._parent_canvas, bg=fg_color, highlightthickness=0)
+        self._window_id = self._parent_canvas.create_window(0, 0, window=self, anchor="nw")
+        self.bind("<Configure>", lambda e: self._parent_canvas.configure(scrollregion=self._parent_canvas.bbox("all")))
+        self._parent_canvas.bind("<Configure>", lambda e: self._parent_canvas.itemconfigure(self._window_id, width=e.width))
+
+    def cget(self, key):
+        # CTk children ask their master for fg_color to pick their own bg_color
+        if key == "fg_color":
+            return Frame.cget(self, "bg")
+        return super().cget(key)
+
+    def destroy(self):
+        super().destroy()
+        self._parent_frame.destroy()
+
+    def pack(self, **kwargs):
+        self._parent_frame.pack(**kwargs)
+
+    def grid(self, **kwargs):
+        self._parent_frame.grid(**kwargs)
+
+    def place(self, **kwargs):
+        self._parent_frame.place(**kwargs)
+
+    def pack_forget(self):
+        self._parent_frame.pack_forget()
+
+    def grid_forget(self):
+        self._parent_frame.grid_forget()
+
+    def place_forget(self):
+        self._parent_frame.place_forget()
+
+
+class _LazyIcons(dict):
+    """
+    Dict of icon factories: each entry is built on first lookup and memoized,
+    so icon variants that are never shown never allocate PIL or Tk images.
+    """
+    def __init__(self, factories):
+        super().__init__()
+        self._factories = factories
+
+    def __missing__(self, key):
+        value = self._factories[key]()
+        self[key] = value
+        return value
+
+    def __contains__(self, key):
+        return key in self._factories
+
+    def get(self, key, default=None):
+        return self[key] if key in self._factories else default
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # MAIN APPLICATION
 # ═══════════════════════════════════════════════════════════════════════════════
 
+# Output-log separator line and per-type line prefixes
+_SEPARATOR = "━" * 50
+_LOG_PREFIXES = {"success": "✓", "error": "✗", "warning": "⚠"}
+# Status-bar dot colour per status type (anything else uses ACCENT_PRIMARY)
+_STATUS_COLORS = {"success": Colors.SUCCESS, "error": Colors.ERROR, "warning": Colors.WARNING}
+
+# Initial output-box banners, composed once and written with a single insert
+_ENCRYPT_WELCOME = (
+    f"{Colors.ICON_LOCK} Ready to encrypt your password.\n"
+    f"{_SEPARATOR}\n"
+    "Enter your password and master password above, then click 'Start Encryption'.\n"
+)
+_DECRYPT_WELCOME = (
+    "🔓 Ready to decrypt your password.\n"
+    f"{_SEPARATOR}\n"
+    "Select at least 2 stego images and enter your master password.\n"
+)
+_MANUAL_WELCOME = (
+    "🔓 Manual decryption mode.\n"
+    f"{_SEPARATOR}\n"
+    "Use this if you saved encrypted data as a .bin file.\n"
+)
+
 class FracturedKeyApp(ctk.CTk):
+    # Rendered PIL nav/landing icons shared by every window instance (colors are fixed,
+    # not theme-dependent). Only PIL images live here: CTkImage/PhotoImage belong to one Tk
+    # interpreter, so each window wraps them itself.
+    _NAV_ICON_PIL = None
+
     def __init__(self):
         super().__init__()
 
@@ -594,11 +717,26 @@ class FracturedKeyApp(ctk.CTk):
         self.current_tab = "encrypt"
         self._show_landing = True
 
+        # Hidden toggle: dump the raw salt/nonce/ciphertext to the encryption log.
+        # On with FRACTURED_DEBUG=1 in the environment; Ctrl+Shift+D flips it anywhere in the window.
+        self.debug_var = ctk.BooleanVar(value=os.environ.get("FRACTURED_DEBUG", "") not in ("", "0"))
+        self.bind("<Control-D>", self._toggle_debug_output)
+
+        # Output-log lines are queued (from any thread) and written in batches by a
+        # recurring pump on the Tk thread; workers never touch Tk themselves
+        self._log_queue = queue.SimpleQueue()
+        self.after(33, self._drain_log_queue)
+
         # Global, under-cursor smooth scrolling (Linux touchpad friendly)
         self._setup_global_scrolling()
 
         # High-visibility icon images for Linux (no emoji/font dependency)
-        self._init_icon_images()
+        self._nav_icon_images = type(self)._get_nav_icons()
+        # Flat per-state views, still resolved lazily through the nested cache
+        icons = self._nav_icon_images
+        glyph_names = [name for name in icons._factories if name != "header"]
+        self._active_icons = _LazyIcons({name: (lambda name=name: icons[name]["active"]) for name in glyph_names})
+        self._muted_icons = _LazyIcons({name: (lambda name=name: icons[name]["muted"]) for name in glyph_names})
 
         # Root stack: landing page OR main app
         self.root_stack = ctk.CTkFrame(self, fg_color="transparent")
@@ -625,12 +763,15 @@ class FracturedKeyApp(ctk.CTk):
         Route scroll events to the scrollable container under the cursor.
         This makes touchpad scrolling coordinate correctly with the visible scrollbar on Linux.
         """
-        def find_scroll_canvas(widget):
+        def walk_scroll_canvas(widget):
             w = widget
-            # Walk up the widget tree looking for a CTkScrollableFrame (has _parent_canvas)
+            # Walk up the widget tree looking for a LeanScrollFrame/CTkScrollableFrame (has _parent_canvas)
             for _ in range(30):
                 if w is None:
                     break
+                # Registered scroll frames: a plain set lookup, no Tcl round-trip
+                if w in _SCROLL_TARGETS:
+                    return w._parent_canvas
                 # Only treat a tkinter Canvas as scroll-target if it's actually scrollable.
                 # (Avoid decorative canvases like PixelatedCard border overlays, which caused "container moving".)
                 try:
@@ -661,10 +802,29 @@ class FracturedKeyApp(ctk.CTk):
                     break
             return None
 
+        missing = object()
+
+        def find_scroll_canvas(widget):
+            # The scroll target is an ancestor and widgets never reparent, so the walk
+            # (with its per-level cget round-trips) only has to run once per widget.
+            # The cached value dies with the widget, so no <Destroy> cleanup is needed.
+            target = getattr(widget, "_scroll_target", missing)
+            if target is not missing:
+                return target
+            target = walk_scroll_canvas(widget)
+            try:
+                widget._scroll_target = target
+            except Exception:
+                pass
+            return target
+
         def wheel_units_from_event(event):
             d = getattr(event, "delta", 0) or 0
             if d == 0:
                 return 0
+            units = _WHEEL_LUT.get(d)
+            if units is not None:
+                return units
             # Windows/Mac usually send ±120; Linux touchpads often send smaller values.
             if abs(d) >= 120:
                 return -1 * (d / 120.0) * 6.0
@@ -704,49 +864,90 @@ class FracturedKeyApp(ctk.CTk):
         except Exception:
             pass
 
-    def _init_icon_images(self):
+    @classmethod
+    def _get_nav_icons(cls):
         """
         Create crisp icon images so they are clearly visible on Linux without relying on emoji fonts.
+        The PIL renders are made once per process; each call returns fresh, lazily built CTkImages.
         """
-        def make_img(draw_fn, color_hex, size=22, stroke=2):
-            img = Image.new("RGBA", (size, size), (0, 0, 0, 0))
-            d = ImageDraw.Draw(img)
-            draw_fn(d, size, stroke, color_hex)
-            return ctk.CTkImage(light_image=img, dark_image=img, size=(size, size))
-
-        def draw_lock(d, size, stroke, color):
+        masks = {}
+
+        def glyph_mask(draw_fn, size, stroke):
+            # Each glyph is rasterized once as an alpha mask; every color variant reuses it
+            key = (draw_fn, size, stroke)
+            mask = masks.get(key)
+            if mask is None:
+                mask = Image.new("L", (size, size), 0)
+                draw_fn(mask, size, stroke, 255)
+                masks[key] = mask
+            return mask
+
+        def render(draw_fn, color_hex, size=22, stroke=2):
+            img = Image.new("RGBA", (size, size), color_hex)
+            img.putalpha(glyph_mask(draw_fn, size, stroke))
+            return img
+
+        def draw_ctx(img):
+            # ImageDraw is imported on first use, normally on the icon worker thread
+            from PIL import ImageDraw
+            return ImageDraw.Draw(img)
+
+        # Axis-aligned strokes are written straight into the pixel buffer with
+        # Image.paste (one C-level block fill each). Only glyphs with arcs, ellipses,
+        # diagonals or polygons open an ImageDraw context. Inclusive coords, like ImageDraw.
+        def fill_rect(img, x0, y0, x1, y1, color):
+            img.paste(color, (x0, y0, x1 + 1, y1 + 1))
+
+        def hline(img, x0, x1, y, stroke, color):
+            fill_rect(img, x0, y, x1, y + stroke - 1, color)
+
+        def vline(img, x, y0, y1, stroke, color):
+            fill_rect(img, x, y0, x + stroke - 1, y1, color)
+
+        def rect_outline(img, x0, y0, x1, y1, stroke, color):
+            hline(img, x0, x1, y0, stroke, color)
+            hline(img, x0, x1, y1 - stroke + 1, stroke, color)
+            vline(img, x0, y0, y1, stroke, color)
+            vline(img, x1 - stroke + 1, y0, y1, stroke, color)
+
+        def draw_lock(img, size, stroke, color):
+            d = draw_ctx(img)
             # body
-            d.rectangle([6, 10, size-6, size-5], outline=color, width=stroke)
+            rect_outline(img, 6, 10, size-6, size-5, stroke, color)
             # shackle
             d.arc([6, 2, size-6, 14], start=0, end=180, fill=color, width=stroke)
-            d.line([6, 10, 6, 11], fill=color, width=stroke)
-            d.line([size-6, 10, size-6, 11], fill=color, width=stroke)
+            vline(img, 6, 10, 11, stroke, color)
+            vline(img, size-6, 10, 11, stroke, color)
 
-        def draw_unlock(d, size, stroke, color):
-            d.rectangle([6, 10, size-6, size-5], outline=color, width=stroke)
+        def draw_unlock(img, size, stroke, color):
+            d = draw_ctx(img)
+            rect_outline(img, 6, 10, size-6, size-5, stroke, color)
             # open shackle (shifted right)
             d.arc([8, 2, size-4, 14], start=200, end=360, fill=color, width=stroke)
-            d.line([8, 8, 8, 10], fill=color, width=stroke)
+            vline(img, 8, 8, 10, stroke, color)
 
-        def draw_folder(d, size, stroke, color):
-            d.rectangle([3, 7, size-3, size-4], outline=color, width=stroke)
-            d.rectangle([3, 5, 10, 7], outline=color, width=stroke)
+        def draw_folder(img, size, stroke, color):
+            rect_outline(img, 3, 7, size-3, size-4, stroke, color)
+            rect_outline(img, 3, 5, 10, 7, stroke, color)
 
-        def draw_key(d, size, stroke, color):
+        def draw_key(img, size, stroke, color):
+            d = draw_ctx(img)
             # key head
             d.ellipse([3, 7, 10, 14], outline=color, width=stroke)
             # key stem
-            d.line([10, 11, size-3, 11], fill=color, width=stroke)
+            hline(img, 10, size-3, 11, stroke, color)
             # teeth
-            d.line([size-7, 11, size-7, 15], fill=color, width=stroke)
-            d.line([size-5, 11, size-5, 13], fill=color, width=stroke)
+            vline(img, size-7, 11, 15, stroke, color)
+            vline(img, size-5, 11, 13, stroke, color)
 
-        def draw_info(d, size, stroke, color):
+        def draw_info(img, size, stroke, color):
+            d = draw_ctx(img)
             d.ellipse([3, 3, size-3, size-3], outline=color, width=stroke)
-            d.line([size//2, 9, size//2, size-7], fill=color, width=stroke)
+            vline(img, size//2, 9, size-7, stroke, color)
             d.ellipse([size//2 - 1, 6, size//2 + 1, 8], fill=color, outline=color)
 
-        def draw_shuffle(d, size, stroke, color):
+        def draw_shuffle(img, size, stroke, color):
+            d = draw_ctx(img)
             # Two crossing arrows
             d.line([4, 7, size-8, size-7], fill=color, width=stroke)
             d.line([4, size-7, size-8, 7], fill=color, width=stroke)
@@ -754,17 +955,20 @@ class FracturedKeyApp(ctk.CTk):
             d.polygon([(size-8, size-7), (size-11, size-9), (size-11, size-5)], outline=color, fill=None)
             d.polygon([(size-8, 7), (size-11, 5), (size-11, 9)], outline=color, fill=None)
 
-        def draw_image(d, size, stroke, color):
-            d.rectangle([4, 5, size-4, size-5], outline=color, width=stroke)
+        def draw_image(img, size, stroke, color):
+            d = draw_ctx(img)
+            rect_outline(img, 4, 5, size-4, size-5, stroke, color)
             d.polygon([(6, size-7), (10, size-11), (14, size-9), (size-6, size-7)], outline=color, fill=None)
             d.ellipse([size-10, 8, size-7, 11], outline=color, width=stroke)
 
-        def draw_offline(d, size, stroke, color):
+        def draw_offline(img, size, stroke, color):
+            d = draw_ctx(img)
             # Circle with slash
             d.ellipse([4, 4, size-4, size-4], outline=color, width=stroke)
             d.line([7, size-7, size-7, 7], fill=color, width=stroke)
 
-        def draw_shield(d, size, stroke, color):
+        def draw_shield(img, size, stroke, color):
+            d = draw_ctx(img)
             # Simple shield outline
             d.polygon(
                 [(size//2, 3), (size-5, 6), (size-6, size-9), (size//2, size-4), (6, size-9), (5, 6)],
@@ -772,64 +976,71 @@ class FracturedKeyApp(ctk.CTk):
                 fill=None
             )
 
-        def draw_gear(d, size, stroke, color):
+        def draw_gear(img, size, stroke, color):
+            d = draw_ctx(img)
             # Simple gear: outer circle + inner circle + 4 teeth
             d.ellipse([5, 5, size-5, size-5], outline=color, width=stroke)
             d.ellipse([9, 9, size-9, size-9], outline=color, width=stroke)
             # teeth
-            d.line([size//2, 2, size//2, 6], fill=color, width=stroke)
-            d.line([size//2, size-6, size//2, size-2], fill=color, width=stroke)
-            d.line([2, size//2, 6, size//2], fill=color, width=stroke)
-            d.line([size-6, size//2, size-2, size//2], fill=color, width=stroke)
+            vline(img, size//2, 2, 6, stroke, color)
+            vline(img, size//2, size-6, size-2, stroke, color)
+            hline(img, 2, 6, size//2, stroke, color)
+            hline(img, size-6, size-2, size//2, stroke, color)
 
         # Two states for nav: muted + active (so visibility is good on Linux)
         muted = Colors.TEXT_SECONDARY
         active = Colors.ACCENT_PRIMARY
 
-        self._nav_icon_images = {
-            "encrypt": {
-                "muted": make_img(draw_lock, muted),
-                "active": make_img(draw_lock, active),
-            },
-            "decrypt": {
-                "muted": make_img(draw_unlock, muted),
-                "active": make_img(draw_unlock, active),
-            },
-            "manual": {
-                "muted": make_img(draw_folder, muted),
-                "active": make_img(draw_folder, active),
-            },
-            "about": {
-                "muted": make_img(draw_info, muted),
-                "active": make_img(draw_info, active),
-            },
-            "header": make_img(draw_lock, active, size=24, stroke=2),
-            "key": {
-                "muted": make_img(draw_key, muted),
-                "active": make_img(draw_key, active),
-            },
+        glyphs = {
+            "encrypt": draw_lock,
+            "decrypt": draw_unlock,
+            "manual": draw_folder,
+            "about": draw_info,
+            "key": draw_key,
             # Extra icons for intro/landing page (avoid emoji -> no "?" on Linux)
-            "shuffle": {
-                "muted": make_img(draw_shuffle, muted),
-                "active": make_img(draw_shuffle, active),
-            },
-            "image": {
-                "muted": make_img(draw_image, muted),
-                "active": make_img(draw_image, active),
-            },
-            "offline": {
-                "muted": make_img(draw_offline, muted),
-                "active": make_img(draw_offline, active),
-            },
-            "shield": {
-                "muted": make_img(draw_shield, muted),
-                "active": make_img(draw_shield, active),
-            },
-            "settings": {
-                "muted": make_img(draw_gear, muted),
-                "active": make_img(draw_gear, active),
-            },
+            "shuffle": draw_shuffle,
+            "image": draw_image,
+            "offline": draw_offline,
+            "shield": draw_shield,
+            "settings": draw_gear,
         }
+        pil_image = cls._NAV_ICON_PIL
+        if pil_image is None:
+            rendered = {}
+
+            def render_all():
+                # Pure PIL work, no Tk calls: runs off the Tk thread while the window is built
+                for name, draw_fn in glyphs.items():
+                    rendered[name, "muted"] = render(draw_fn, muted)
+                    rendered[name, "active"] = render(draw_fn, active)
+                rendered["header"] = render(draw_lock, active, size=24, stroke=2)
+
+            worker = threading.Thread(target=render_all, daemon=True)
+            worker.start()
+
+            def pil_image(key):
+                worker.join()
+                if key not in rendered:
+                    render_all()  # worker failed; render on this thread instead
+                return rendered[key]
+
+            cls._NAV_ICON_PIL = pil_image
+
+        def make_img(key):
+            # CTkImage registers Tk images, so it is built here on the Tk thread, on first lookup
+            img = pil_image(key)
+            return ctk.CTkImage(light_image=img, dark_image=img, size=img.size)
+
+        def variants(name):
+            return _LazyIcons({
+                "muted": lambda: make_img((name, "muted")),
+                "active": lambda: make_img((name, "active")),
+            })
+
+        # Built lazily on first lookup; call sites keep the [name]["active"] syntax
+        factories = {name: (lambda name=name: variants(name)) for name in glyphs}
+        factories["header"] = lambda: make_img("header")
+        return _LazyIcons(factories)
 
     def _create_landing_page(self):
         """Attractive, interactive Introduction / Landing Page"""
@@ -865,36 +1076,34 @@ class FracturedKeyApp(ctk.CTk):
 
         # Hero section — wrapped in a pixelated card
         hero_card = PixelatedCard(inner)
-        hero_card_inner = ctk.CTkFrame(hero_card, fg_color="transparent")
-        hero_card_inner.pack(fill="x", padx=40, pady=36)
 
         # Large hero title
         hero_label = ctk.CTkLabel(
-            hero_card_inner,
+            hero_card,
             text="Fractured Key",
             font=Fonts.HERO,
             text_color=Colors.TEXT_PRIMARY
         )
-        hero_label.pack(anchor="center", pady=(0, 14))
+        hero_label.pack(anchor="center", padx=40, pady=(36, 14))
 
         # Accent line (light blue)
         underline = ctk.CTkFrame(
-            hero_card_inner,
+            hero_card,
             fg_color=Colors.ACCENT_PRIMARY,
             height=4,
             width=140,
             corner_radius=2
         )
-        underline.pack(anchor="center", pady=(0, 18))
+        underline.pack(anchor="center", padx=40, pady=(0, 18))
 
         # Tagline — more prominent
         tagline = ctk.CTkLabel(
-            hero_card_inner,
+            hero_card,
             text="A next-generation secure authentication system",
             font=Fonts.TAGLINE,
             text_color=Colors.TEXT_ACCENT
         )
-        tagline.pack(anchor="center", pady=(0, 20))
+        tagline.pack(anchor="center", padx=40, pady=(0, 20))
 
         # Short engaging description
         desc_text = (
@@ -903,27 +1112,27 @@ class FracturedKeyApp(ctk.CTk):
             "Recover only when you have enough fragments and your master password."
         )
         desc = ctk.CTkLabel(
-            hero_card_inner,
+            hero_card,
             text=desc_text,
             font=Fonts.BODY_LG,
             text_color=Colors.TEXT_SECONDARY,
             wraplength=640,
             justify="center"
         )
-        desc.pack(anchor="center", pady=(0, 12))
+        desc.pack(anchor="center", padx=40, pady=(0, 12))
 
         # Bullet highlights (inline, interactive feel)
         bullets = ctk.CTkLabel(
-            hero_card_inner,
+            hero_card,
             text="AES-256-GCM  ·  Argon2id  ·  LSB steganography  ·  Offline-first",
             font=Fonts.BODY_SM,
             text_color=Colors.TEXT_MUTED
         )
-        bullets.pack(anchor="center", pady=(0, 28))
+        bullets.pack(anchor="center", padx=40, pady=(0, 28))
 
         # CTA buttons — Get Started (primary), Explore Features (secondary). No Login.
-        cta_frame = ctk.CTkFrame(hero_card_inner, fg_color="transparent")
-        cta_frame.pack(anchor="center", pady=(0, 8))
+        cta_frame = ctk.CTkFrame(hero_card, fg_color="transparent")
+        cta_frame.pack(anchor="center", padx=40, pady=(0, 44))
 
         btn_get_started = AccentButton(
             cta_frame,
@@ -943,88 +1152,99 @@ class FracturedKeyApp(ctk.CTk):
         )
         btn_explore.pack(side="left", padx=12)
 
-        # Section divider with label (no pack — animated)
-        section_label = ctk.CTkLabel(
-            inner,
-            text="Why Fractured Key",
-            font=Fonts.TITLE_MD,
-            text_color=Colors.TEXT_PRIMARY
-        )
-
-        hint = ctk.CTkLabel(
-            inner,
-            text="Scroll to explore features",
-            font=Fonts.CAPTION,
-            text_color=Colors.TEXT_MUTED
-        )
-
-        # Feature cards — more attractive layout with consistent hover (GlowingCard)
-        features_container = ctk.CTkFrame(inner, fg_color="transparent")
-
-        features = [
-            ("encrypt", "Military-grade encryption", "AES-256-GCM + Argon2id key derivation"),
-            ("shuffle", "Fragmented secrets", "Shamir Secret Sharing — partial fragments recover the whole"),
-            ("image", "Hidden in plain sight", "LSB steganography embeds data inside images"),
-            ("offline", "Offline-first", "No cloud dependency; everything stays on your device"),
-            ("shield", "Recovery by design", "Only enough fragments + master password to decrypt"),
-        ]
+        # Sections below the hero are built on their first reveal tick, not up front
+        def build_section_label():
+            # Section divider with label
+            return ctk.CTkLabel(
+                inner,
+                text="Why Fractured Key",
+                font=Fonts.TITLE_MD,
+                text_color=Colors.TEXT_PRIMARY
+            )
 
-        for icon_key, title, desc in features:
-            card = GlowingCard(features_container)
-            card.pack(fill="x", pady=10, padx=16)
-            card_inner = ctk.CTkFrame(card, fg_color="transparent")
-            card_inner.pack(fill="x", padx=28, pady=22)
-
-            # Linux-safe icon (image) — avoid emoji "?" on intro page
-            icon_img = self._nav_icon_images.get(icon_key, {}).get("active") if isinstance(self._nav_icon_images.get(icon_key), dict) else None
-            if icon_img is None:
-                # fallback to known keys
-                icon_img = self._nav_icon_images.get("about", {}).get("active")
-            ctk.CTkLabel(
-                card_inner,
-                text="",
-                image=icon_img
-            ).pack(anchor="w", pady=(0, 12))
+        def build_hint():
+            return ctk.CTkLabel(
+                inner,
+                text="Scroll to explore features",
+                font=Fonts.CAPTION,
+                text_color=Colors.TEXT_MUTED
+            )
 
-            ctk.CTkLabel(
-                card_inner,
-                text=title,
-                font=Fonts.TITLE_SM,
-                text_color=Colors.TEXT_PRIMARY
-            ).pack(anchor="w", pady=(0, 6))
-            ctk.CTkLabel(
-                card_inner,
-                text=desc,
-                font=Fonts.BODY_SM,
-                text_color=Colors.TEXT_MUTED,
-                wraplength=560,
-                justify="left"
-            ).pack(anchor="w")
-
-        # Footer (no pack — animated)
-        footer = ctk.CTkLabel(
-            inner,
-            text="Secure · Offline · Portfolio-ready",
-            font=Fonts.CAPTION,
-            text_color=Colors.TEXT_MUTED
-        )
+        def build_features():
+            # Feature cards — more attractive layout with consistent hover (GlowingCard)
+            features_container = ctk.CTkFrame(inner, fg_color="transparent")
+            features_container.grid_columnconfigure(0, weight=1)
+
+            features = [
+                ("encrypt", "Military-grade encryption", "AES-256-GCM + Argon2id key derivation"),
+                ("shuffle", "Fragmented secrets", "Shamir Secret Sharing — partial fragments recover the whole"),
+                ("image", "Hidden in plain sight", "LSB steganography embeds data inside images"),
+                ("offline", "Offline-first", "No cloud dependency; everything stays on your device"),
+                ("shield", "Recovery by design", "Only enough fragments + master password to decrypt"),
+            ]
+
+            # One grid column: all rows are laid out in a single geometry pass
+            for row, (icon_key, title, desc) in enumerate(features):
+                card = GlowingCard(features_container)
+                card.grid(row=row, column=0, sticky="ew", padx=16, pady=10)
+
+                # Linux-safe icon (image) — avoid emoji "?" on intro page.
+                # Icon and title share one compound label (one widget instead of two)
+                icon_img = self._active_icons.get(icon_key) or self._active_icons["about"]
+                ctk.CTkLabel(
+                    card,
+                    text="  " + title,
+                    image=icon_img,
+                    compound="left",
+                    font=Fonts.TITLE_SM,
+                    text_color=Colors.TEXT_PRIMARY
+                ).pack(anchor="w", padx=28, pady=(22, 8))
+                ctk.CTkLabel(
+                    card,
+                    text=desc,
+                    font=Fonts.BODY_SM,
+                    text_color=Colors.TEXT_MUTED,
+                    wraplength=560,
+                    justify="left"
+                ).pack(anchor="w", padx=28, pady=(0, 22))
+            return features_container
+
+        def build_footer():
+            return ctk.CTkLabel(
+                inner,
+                text="Secure · Offline · Portfolio-ready",
+                font=Fonts.CAPTION,
+                text_color=Colors.TEXT_MUTED
+            )
 
-        # Staggered reveal animation: pack widgets in sequence
+        # Staggered reveal animation: (builder, pack options) per section, packed in sequence
         self._landing_reveal = [
-            (hero_card, {"fill": "x", "pady": (24, 32), "padx": 24}),
-            (section_label, {"anchor": "center", "pady": (36, 8)}),
-            (hint, {"anchor": "center", "pady": (0, 20)}),
-            (features_container, {"fill": "x", "pady": (0, 28)}),
-            (footer, {"anchor": "center", "pady": (24, 28)}),
+            (lambda: hero_card, {"fill": "x", "pady": (24, 32), "padx": 24}),
+            (build_section_label, {"anchor": "center", "pady": (36, 8)}),
+            (build_hint, {"anchor": "center", "pady": (0, 20)}),
+            (build_features, {"fill": "x", "pady": (0, 28)}),
+            (build_footer, {"anchor": "center", "pady": (24, 28)}),
+        ]
+        self._landing_widgets = [None] * len(self._landing_reveal)
+        self._landing_reveal_jobs = []
+        self._schedule_landing_reveal(180)
+
+    def _schedule_landing_reveal(self, delay_ms, step_ms=130):
+        """Schedule the whole staggered reveal up front (one timer per section)."""
+        for job in self._landing_reveal_jobs:
+            self.after_cancel(job)
+        self._landing_reveal_jobs = [
+            self.after(delay_ms + step_ms * i, self._reveal_landing_section, i)
+            for i in range(len(self._landing_reveal))
         ]
-        self.after(180, lambda: self._reveal_next_landing(0))
 
-    def _reveal_next_landing(self, i):
-        """Reveal next landing section (staggered animation)."""
-        if i < len(self._landing_reveal):
-            widget, kwargs = self._landing_reveal[i]
-            widget.pack(**kwargs)
-            self.after(130, lambda: self._reveal_next_landing(i + 1))
+    def _reveal_landing_section(self, i):
+        """Build landing section i on its first reveal, then pack it."""
+        builder, kwargs = self._landing_reveal[i]
+        widget = self._landing_widgets[i]
+        if widget is None:
+            widget = self._landing_widgets[i] = builder()
+        widget.pack(**kwargs)
 
     def _enter_app(self, tab_id="encrypt"):
         """Switch from landing page to main app and optionally open a tab."""
@@ -1041,14 +1261,15 @@ class FracturedKeyApp(ctk.CTk):
             return
         self._show_landing = True
         self.main_container.pack_forget()
+        # Unpack sections so staggered reveal animation runs again: one Tcl call for all of
+        # them, before the landing frame is mapped, so there is a single relayout
+        try:
+            self.tk.call("pack", "forget", *(w._w for w in self._landing_widgets if w is not None))
+        except Exception:
+            pass
         self.landing_frame.pack(fill="both", expand=True)
-        # Unpack sections so staggered reveal animation runs again
-        for widget, _ in self._landing_reveal:
-            try:
-                widget.pack_forget()
-            except Exception:
-                pass
-        self.after(120, lambda: self._reveal_next_landing(0))
+        self.update_idletasks()
+        self._schedule_landing_reveal(120)
 
     def _create_layout(self):
         """Main app layout structure"""
@@ -1067,18 +1288,17 @@ class FracturedKeyApp(ctk.CTk):
         header.grid(row=0, column=0, columnspan=2, sticky="ew")
         header.grid_propagate(False)
 
-        title_frame = ctk.CTkFrame(header, fg_color="transparent")
-        title_frame.pack(side="left", padx=28, pady=14)
-
+        # Header items pack straight into the header (no grouping frames); only the
+        # title/subtitle pair needs a frame to stack vertically
         icon_label = ctk.CTkLabel(
-            title_frame,
+            header,
             text="",
             image=self._nav_icon_images["header"]
         )
-        icon_label.pack(side="left", padx=(0, 14))
+        icon_label.pack(side="left", padx=(28, 14), pady=14)
 
-        title_text = ctk.CTkFrame(title_frame, fg_color="transparent")
-        title_text.pack(side="left")
+        title_text = ctk.CTkFrame(header, fg_color="transparent")
+        title_text.pack(side="left", pady=14)
 
         ctk.CTkLabel(
             title_text,
@@ -1094,21 +1314,9 @@ class FracturedKeyApp(ctk.CTk):
             text_color=Colors.TEXT_MUTED
         ).pack(anchor="w")
 
-        # Right side: Back to Introduction + version
-        header_right = ctk.CTkFrame(header, fg_color="transparent")
-        header_right.pack(side="right", padx=28, pady=14)
-
-        btn_intro = SecondaryButton(
-            header_right,
-            text="  Back to Introduction  ",
-            command=self._show_landing_page,
-            height=40,
-            width=180
-        )
-        btn_intro.pack(side="left", padx=(0, 12))
-
+        # Right side: Back to Introduction + version (packed right-to-left)
         version_badge = ctk.CTkLabel(
-            header_right,
+            header,
             text=" v2.0 ",
             font=Fonts.CAPTION,
             text_color=Colors.TEXT_MUTED,
@@ -1117,7 +1325,16 @@ class FracturedKeyApp(ctk.CTk):
             padx=12,
             pady=5
         )
-        version_badge.pack(side="left")
+        version_badge.pack(side="right", padx=(0, 28), pady=14)
+
+        btn_intro = SecondaryButton(
+            header,
+            text="  Back to Introduction  ",
+            command=self._show_landing_page,
+            height=40,
+            width=180
+        )
+        btn_intro.pack(side="right", padx=(0, 12), pady=14)
         
     def _create_sidebar(self):
         """Create the navigation sidebar - clean, modern"""
@@ -1143,6 +1360,20 @@ class FracturedKeyApp(ctk.CTk):
 
         self.nav_buttons = {}
 
+        def set_hover(f, t, color):
+            # Coalesce Enter/Leave bursts (fast sweeps) into one configure per idle pass;
+            # the current tab is checked when it runs, so a click in between wins
+            job = getattr(f, "_hover_after", None)
+            if job is not None:
+                self.after_cancel(job)
+
+            def apply():
+                f._hover_after = None
+                if self.current_tab != t:
+                    f.configure(fg_color=color)
+
+            f._hover_after = self.after_idle(apply)
+
         for tab_id, icon, title, subtitle in nav_items:
             btn_frame = ctk.CTkFrame(
                 nav_frame,
@@ -1152,23 +1383,18 @@ class FracturedKeyApp(ctk.CTk):
             )
             btn_frame.pack(fill="x", pady=6)
 
-            btn_frame.bind("<Button-1>", lambda e, t=tab_id: self._show_tab(t))
-
             content = ctk.CTkFrame(btn_frame, fg_color="transparent")
             content.pack(fill="x", padx=14, pady=12)
-            content.bind("<Button-1>", lambda e, t=tab_id: self._show_tab(t))
 
             icon_lbl = ctk.CTkLabel(
                 content,
                 text="",
-                image=self._nav_icon_images[tab_id]["muted"]
+                image=self._muted_icons[tab_id]
             )
             icon_lbl.pack(side="left", padx=(0, 14))
-            icon_lbl.bind("<Button-1>", lambda e, t=tab_id: self._show_tab(t))
 
             text_container = ctk.CTkFrame(content, fg_color="transparent")
             text_container.pack(side="left", fill="x", expand=True)
-            text_container.bind("<Button-1>", lambda e, t=tab_id: self._show_tab(t))
 
             title_lbl = ctk.CTkLabel(
                 text_container,
@@ -1178,7 +1404,6 @@ class FracturedKeyApp(ctk.CTk):
                 anchor="w"
             )
             title_lbl.pack(anchor="w")
-            title_lbl.bind("<Button-1>", lambda e, t=tab_id: self._show_tab(t))
 
             subtitle_lbl = ctk.CTkLabel(
                 text_container,
@@ -1188,7 +1413,6 @@ class FracturedKeyApp(ctk.CTk):
                 anchor="w"
             )
             subtitle_lbl.pack(anchor="w")
-            subtitle_lbl.bind("<Button-1>", lambda e, t=tab_id: self._show_tab(t))
 
             self.nav_buttons[tab_id] = {
                 "frame": btn_frame,
@@ -1197,16 +1421,28 @@ class FracturedKeyApp(ctk.CTk):
                 "subtitle": subtitle_lbl
             }
 
+            # One class binding per nav item instead of a <Button-1> on every sub-widget.
+            # CTk widgets are built from inner Tk canvases/labels, so tag the whole subtree.
+            click_tag = "nav:" + tab_id
+            pending = [btn_frame]
+            while pending:
+                w = pending.pop()
+                w.bindtags((click_tag,) + w.bindtags())
+                pending.extend(w.winfo_children())
+            self.bind_class(click_tag, "<Button-1>", lambda e, t=tab_id: self._show_tab(t))
+
             def on_enter(e, f=btn_frame, t=tab_id):
-                if self.current_tab != t:
-                    f.configure(fg_color=Colors.BG_HOVER)
+                set_hover(f, t, Colors.BG_HOVER)
 
             def on_leave(e, f=btn_frame, t=tab_id):
-                if self.current_tab != t:
-                    f.configure(fg_color="transparent")
+                set_hover(f, t, "transparent")
 
-            btn_frame.bind("<Enter>", on_enter)
-            btn_frame.bind("<Leave>", on_leave)
+            # Hover tag sits on the outer Tk frame only: it sees one Enter/Leave per
+            # crossing of the whole item, not one per child widget
+            hover_tag = "navhover:" + tab_id
+            btn_frame.bindtags((hover_tag,) + btn_frame.bindtags())
+            self.bind_class(hover_tag, "<Enter>", on_enter)
+            self.bind_class(hover_tag, "<Leave>", on_leave)
 
         divider = ctk.CTkFrame(sidebar, fg_color=Colors.BORDER, height=1)
         divider.pack(fill="x", padx=16, pady=24)
@@ -1217,7 +1453,7 @@ class FracturedKeyApp(ctk.CTk):
         ctk.CTkLabel(
             security_frame,
             text="Security",
-            image=self._nav_icon_images["shield"]["muted"],
+            image=self._muted_icons["shield"],
             compound="left",
             font=Fonts.LABEL,
             text_color=Colors.TEXT_SECONDARY
@@ -1230,23 +1466,27 @@ class FracturedKeyApp(ctk.CTk):
             "LSB Steganography"
         ]
 
-        for item in security_items:
-            item_frame = ctk.CTkFrame(security_frame, fg_color="transparent")
-            item_frame.pack(fill="x", pady=4)
+        # Two multi-line labels (bullet column + text column, same font so lines align)
+        # instead of a frame + two labels per item
+        items_frame = ctk.CTkFrame(security_frame, fg_color="transparent")
+        items_frame.pack(fill="x")
 
-            ctk.CTkLabel(
-                item_frame,
-                text="•",
-                font=Fonts.BODY_SM,
-                text_color=Colors.BLUE_GLOW
-            ).pack(side="left", padx=(0, 10))
+        ctk.CTkLabel(
+            items_frame,
+            text="\n".join("•" * len(security_items)),
+            font=Fonts.BODY_SM,
+            text_color=Colors.BLUE_GLOW,
+            justify="left"
+        ).pack(side="left", anchor="n", padx=(0, 10))
 
-            ctk.CTkLabel(
-                item_frame,
-                text=item,
-                font=Fonts.BODY_SM,
-                text_color=Colors.TEXT_MUTED
-            ).pack(side="left")
+        ctk.CTkLabel(
+            items_frame,
+            text="\n".join(security_items),
+            font=Fonts.BODY_SM,
+            text_color=Colors.TEXT_MUTED,
+            justify="left",
+            anchor="w"
+        ).pack(side="left", anchor="n")
             
     def _create_main_content(self):
         """Create the main content area"""
@@ -1258,16 +1498,25 @@ class FracturedKeyApp(ctk.CTk):
         )
         self.content_frame.grid(row=1, column=1, sticky="nsew", padx=0, pady=0)
         
-        # Create all tab frames
+        # Tab frames are built on first visit (see _show_tab)
         self.tabs = {}
-        self.tabs["encrypt"] = self._create_encrypt_tab()
-        self.tabs["decrypt"] = self._create_decrypt_tab()
-        self.tabs["manual"] = self._create_manual_tab()
-        self.tabs["about"] = self._create_about_tab()
+        self._tab_builders = {
+            "encrypt": self._create_encrypt_tab,
+            "decrypt": self._create_decrypt_tab,
+            "manual": self._create_manual_tab,
+            "about": self._create_about_tab,
+        }
         
     def _create_encrypt_tab(self):
         """Create the encryption tab"""
-        tab = ctk.CTkScrollableFrame(
+        # Tab icons, looked up once
+        icons = self._active_icons
+        key_img = icons["key"]
+        encrypt_img = icons["encrypt"]
+        settings_img = icons["settings"]
+        manual_img = icons["manual"]
+
+        tab = LeanScrollFrame(
             self.content_frame,
             fg_color="transparent",
             scrollbar_button_color=Colors.BG_LIGHT,
@@ -1300,72 +1549,66 @@ class FracturedKeyApp(ctk.CTk):
         password_card = GlowingCard(content)
         password_card.pack(fill="x", pady=(0, 20))
         
-        card_content = ctk.CTkFrame(password_card, fg_color="transparent")
-        card_content.pack(fill="x", padx=24, pady=24)
-        
         # Password to encrypt
         ctk.CTkLabel(
-            card_content,
+            password_card,
             text="Password to Encrypt",
-            image=self._nav_icon_images["key"]["active"],
+            image=key_img,
             compound="left",
             font=Fonts.LABEL,
             text_color=Colors.TEXT_PRIMARY
-        ).pack(anchor="w", pady=(0, 8))
+        ).pack(anchor="w", padx=24, pady=(24, 8))
         
         self.encrypt_password_entry = ModernEntry(
-            card_content,
+            password_card,
             placeholder="Enter the password you want to protect...",
             is_password=True,
             width=500
         )
-        self.encrypt_password_entry.pack(fill="x", pady=(0, 20))
+        self.encrypt_password_entry.pack(fill="x", padx=24, pady=(0, 20))
         
         # Master password
         ctk.CTkLabel(
-            card_content,
+            password_card,
             text="Master Password",
-            image=self._nav_icon_images["encrypt"]["active"],
+            image=encrypt_img,
             compound="left",
             font=Fonts.LABEL,
             text_color=Colors.TEXT_PRIMARY
-        ).pack(anchor="w", pady=(0, 8))
+        ).pack(anchor="w", padx=24, pady=(0, 8))
         
         self.encrypt_master_entry = ModernEntry(
-            card_content,
+            password_card,
             placeholder="Enter your master password...",
             is_password=True,
             width=500
         )
-        self.encrypt_master_entry.pack(fill="x", pady=(0, 8))
+        self.encrypt_master_entry.pack(fill="x", padx=24, pady=(0, 8))
         
         ctk.CTkLabel(
-            card_content,
+            password_card,
             text="This password will be used to decrypt your data later",
             font=Fonts.CAPTION,
             text_color=Colors.TEXT_MUTED
-        ).pack(anchor="w")
+        ).pack(anchor="w", padx=24, pady=(0, 24))
         
         # Options card
         options_card = GlowingCard(content)
         options_card.pack(fill="x", pady=(0, 20))
         
-        options_content = ctk.CTkFrame(options_card, fg_color="transparent")
-        options_content.pack(fill="x", padx=24, pady=24)
-        
         ctk.CTkLabel(
-            options_content,
+            options_card,
             text="Encryption Options",
-            image=self._nav_icon_images["settings"]["active"],
+            image=settings_img,
             compound="left",
             font=Fonts.LABEL,
             text_color=Colors.TEXT_PRIMARY
-        ).pack(anchor="w", pady=(0, 15))
+        ).pack(anchor="w", padx=24, pady=(24, 15))
         
         self.use_shares_var = ctk.BooleanVar(value=True)
         
         shares_checkbox = ctk.CTkCheckBox(
-            options_content,
+            options_card,
             text="Split into 3 shares and embed into images",
             variable=self.use_shares_var,
             font=Fonts.BODY_MD,
@@ -1376,14 +1619,14 @@ class FracturedKeyApp(ctk.CTk):
             checkmark_color=Colors.BG_DARKEST,
             corner_radius=6
         )
-        shares_checkbox.pack(anchor="w", pady=(0, 8))
+        shares_checkbox.pack(anchor="w", padx=24, pady=(0, 8))
         
         ctk.CTkLabel(
-            options_content,
+            options_card,
             text="💡 Creates 3 stego images. You need at least 2 to decrypt.",  # Keep emoji for info text
             font=Fonts.BODY_SM,
             text_color=Colors.TEXT_MUTED
-        ).pack(anchor="w", padx=(26, 0))
+        ).pack(anchor="w", padx=(50, 24), pady=(0, 24))
         
         # Action button
         button_frame = ctk.CTkFrame(content, fg_color="transparent")
@@ -1392,7 +1635,7 @@ class FracturedKeyApp(ctk.CTk):
         self.encrypt_btn = AccentButton(
             button_frame,
             text="Start Encryption",
-            image=self._nav_icon_images["encrypt"]["active"],
+            image=encrypt_img,
             compound="left",
             command=self._start_encryption,
             width=220
@@ -1413,7 +1656,7 @@ class FracturedKeyApp(ctk.CTk):
         ctk.CTkLabel(
             output_header,
             text="Output Log",
-            image=self._nav_icon_images["manual"]["active"],
+            image=manual_img,
             compound="left",
             font=Fonts.LABEL,
             text_color=Colors.TEXT_PRIMARY
@@ -1432,15 +1675,20 @@ class FracturedKeyApp(ctk.CTk):
         self.encrypt_output.pack(fill="both", expand=True, padx=24, pady=(0, 24))
         
         # Initial message
-        self.encrypt_output.insert("1.0", f"{Colors.ICON_LOCK} Ready to encrypt your password.\n")
-        self.encrypt_output.insert("end", "━" * 50 + "\n")
-        self.encrypt_output.insert("end", "Enter your password and master password above, then click 'Start Encryption'.\n")
+        self.encrypt_output.insert("1.0", _ENCRYPT_WELCOME)
         
         return tab
         
     def _create_decrypt_tab(self):
         """Create the decryption tab"""
-        tab = ctk.CTkScrollableFrame(
+        # Tab icons, looked up once
+        icons = self._active_icons
+        about_img = icons["about"]
+        manual_img = icons["manual"]
+        encrypt_img = icons["encrypt"]
+        decrypt_img = icons["decrypt"]
+
+        tab = LeanScrollFrame(
             self.content_frame,
             fg_color="transparent",
             scrollbar_button_color=Colors.BG_LIGHT,
@@ -1472,17 +1720,14 @@ class FracturedKeyApp(ctk.CTk):
         instructions_card = GlowingCard(content)
         instructions_card.pack(fill="x", pady=(0, 20))
         
-        instructions_content = ctk.CTkFrame(instructions_card, fg_color="transparent")
-        instructions_content.pack(fill="x", padx=24, pady=24)
-        
         ctk.CTkLabel(
-            instructions_content,
+            instructions_card,
             text="How to Decrypt",
-            image=self._nav_icon_images["about"]["active"],
+            image=about_img,
             compound="left",
             font=Fonts.LABEL,
             text_color=Colors.TEXT_PRIMARY
-        ).pack(anchor="w", pady=(0, 12))
+        ).pack(anchor="w", padx=24, pady=(24, 12))
         
         steps = [
             ("1", "Select at least 2 stego images from the same encryption session"),
@@ -1491,8 +1736,8 @@ class FracturedKeyApp(ctk.CTk):
         ]
         
         for num, text in steps:
-            step_frame = ctk.CTkFrame(instructions_content, fg_color="transparent")
-            step_frame.pack(fill="x", pady=4)
+            step_frame = ctk.CTkFrame(instructions_card, fg_color="transparent")
+            step_frame.pack(fill="x", padx=24, pady=4)
             
             ctk.CTkLabel(
                 step_frame,
@@ -1511,32 +1756,31 @@ class FracturedKeyApp(ctk.CTk):
                 font=Fonts.BODY_MD,
                 text_color=Colors.TEXT_SECONDARY
             ).pack(side="left")
+        # Last row also carries the card's bottom padding (re-pack keeps its position)
+        step_frame.pack(fill="x", padx=24, pady=(4, 28))
         
         # Image selection card
         image_card = GlowingCard(content)
         image_card.pack(fill="x", pady=(0, 20))
         
-        image_content = ctk.CTkFrame(image_card, fg_color="transparent")
-        image_content.pack(fill="x", padx=24, pady=24)
-        
         ctk.CTkLabel(
-            image_content,
+            image_card,
             text="Selected Images",
-            image=self._nav_icon_images["manual"]["active"],
+            image=manual_img,
             compound="left",
             font=Fonts.LABEL,
             text_color=Colors.TEXT_PRIMARY
-        ).pack(anchor="w", pady=(0, 12))
+        ).pack(anchor="w", padx=24, pady=(24, 12))
         
         # Image list
         list_frame = ctk.CTkFrame(
-            image_content,
+            image_card,
             fg_color=Colors.BG_DARKEST,
             corner_radius=10,
             border_width=1,
             border_color=Colors.BORDER
         )
-        list_frame.pack(fill="x", pady=(0, 12))
+        list_frame.pack(fill="x", padx=24, pady=(0, 12))
         
         self.image_listbox = ctk.CTkTextbox(
             list_frame,
@@ -1551,13 +1795,13 @@ class FracturedKeyApp(ctk.CTk):
         self.image_listbox.pack(fill="x", padx=4, pady=4)
         
         # Image buttons
-        btn_frame = ctk.CTkFrame(image_content, fg_color="transparent")
-        btn_frame.pack(fill="x")
+        btn_frame = ctk.CTkFrame(image_card, fg_color="transparent")
+        btn_frame.pack(fill="x", padx=24, pady=(0, 24))
         
         SuccessButton(
             btn_frame,
             text="Add Image",
-            image=self._nav_icon_images["manual"]["active"],
+            image=manual_img,
             compound="left",
             command=self._add_image_file,
             width=140,
@@ -1577,25 +1821,22 @@ class FracturedKeyApp(ctk.CTk):
         password_card = GlowingCard(content)
         password_card.pack(fill="x", pady=(0, 20))
         
-        password_content = ctk.CTkFrame(password_card, fg_color="transparent")
-        password_content.pack(fill="x", padx=24, pady=24)
-        
         ctk.CTkLabel(
-            password_content,
+            password_card,
             text="Master Password",
-            image=self._nav_icon_images["encrypt"]["active"],
+            image=encrypt_img,
             compound="left",
             font=Fonts.LABEL,
             text_color=Colors.TEXT_PRIMARY
-        ).pack(anchor="w", pady=(0, 8))
+        ).pack(anchor="w", padx=24, pady=(24, 8))
         
         self.decrypt_master_entry = ModernEntry(
-            password_content,
+            password_card,
             placeholder="Enter your master password...",
             is_password=True,
             width=500
         )
-        self.decrypt_master_entry.pack(fill="x")
+        self.decrypt_master_entry.pack(fill="x", padx=24, pady=(0, 24))
         
         # Action button
         button_frame = ctk.CTkFrame(content, fg_color="transparent")
@@ -1604,7 +1845,7 @@ class FracturedKeyApp(ctk.CTk):
         self.decrypt_btn = SuccessButton(
             button_frame,
             text="Start Decryption",
-            image=self._nav_icon_images["decrypt"]["active"],
+            image=decrypt_img,
             compound="left",
             command=self._start_decryption,
             width=220
@@ -1625,7 +1866,7 @@ class FracturedKeyApp(ctk.CTk):
         ctk.CTkLabel(
             output_header,
             text="Decryption Results",
-            image=self._nav_icon_images["manual"]["active"],
+            image=manual_img,
             compound="left",
             font=Fonts.LABEL,
             text_color=Colors.TEXT_PRIMARY
@@ -1643,15 +1884,19 @@ class FracturedKeyApp(ctk.CTk):
         self.decrypt_output.pack(fill="both", expand=True, padx=24, pady=(0, 24))
         
         # Initial message
-        self.decrypt_output.insert("1.0", "🔓 Ready to decrypt your password.\n")
-        self.decrypt_output.insert("end", "━" * 50 + "\n")
-        self.decrypt_output.insert("end", "Select at least 2 stego images and enter your master password.\n")
+        self.decrypt_output.insert("1.0", _DECRYPT_WELCOME)
         
         return tab
         
     def _create_manual_tab(self):
         """Create the manual decryption tab"""
-        tab = ctk.CTkScrollableFrame(
+        # Tab icons, looked up once
+        icons = self._active_icons
+        manual_img = icons["manual"]
+        encrypt_img = icons["encrypt"]
+        decrypt_img = icons["decrypt"]
+
+        tab = LeanScrollFrame(
             self.content_frame,
             fg_color="transparent",
             scrollbar_button_color=Colors.BG_LIGHT,
@@ -1683,20 +1928,17 @@ class FracturedKeyApp(ctk.CTk):
         file_card = GlowingCard(content)
         file_card.pack(fill="x", pady=(0, 20))
         
-        file_content = ctk.CTkFrame(file_card, fg_color="transparent")
-        file_content.pack(fill="x", padx=24, pady=24)
-        
         ctk.CTkLabel(
-            file_content,
+            file_card,
             text="Select Binary File",
-            image=self._nav_icon_images["manual"]["active"],
+            image=manual_img,
             compound="left",
             font=Fonts.LABEL,
             text_color=Colors.TEXT_PRIMARY
-        ).pack(anchor="w", pady=(0, 12))
+        ).pack(anchor="w", padx=24, pady=(24, 12))
         
-        file_input_frame = ctk.CTkFrame(file_content, fg_color="transparent")
-        file_input_frame.pack(fill="x")
+        file_input_frame = ctk.CTkFrame(file_card, fg_color="transparent")
+        file_input_frame.pack(fill="x", padx=24, pady=(0, 24))
         
         self.manual_file_entry = ModernEntry(
             file_input_frame,
@@ -1708,7 +1950,7 @@ class FracturedKeyApp(ctk.CTk):
         SecondaryButton(
             file_input_frame,
             text="Browse",
-            image=self._nav_icon_images["manual"]["active"],
+            image=manual_img,
             compound="left",
             command=self._browse_manual_file,
             width=110,
@@ -1719,25 +1961,22 @@ class FracturedKeyApp(ctk.CTk):
         password_card = GlowingCard(content)
         password_card.pack(fill="x", pady=(0, 20))
         
-        password_content = ctk.CTkFrame(password_card, fg_color="transparent")
-        password_content.pack(fill="x", padx=24, pady=24)
-        
         ctk.CTkLabel(
-            password_content,
+            password_card,
             text="Master Password",
-            image=self._nav_icon_images["encrypt"]["active"],
+            image=encrypt_img,
             compound="left",
             font=Fonts.LABEL,
             text_color=Colors.TEXT_PRIMARY
-        ).pack(anchor="w", pady=(0, 8))
+        ).pack(anchor="w", padx=24, pady=(24, 8))
         
         self.manual_master_entry = ModernEntry(
-            password_content,
+            password_card,
             placeholder="Enter your master password...",
             is_password=True,
             width=500
         )
-        self.manual_master_entry.pack(fill="x")
+        self.manual_master_entry.pack(fill="x", padx=24, pady=(0, 24))
         
         # Action button
         button_frame = ctk.CTkFrame(content, fg_color="transparent")
@@ -1746,7 +1985,7 @@ class FracturedKeyApp(ctk.CTk):
         self.manual_decrypt_btn = SuccessButton(
             button_frame,
             text="Decrypt File",
-            image=self._nav_icon_images["decrypt"]["active"],
+            image=decrypt_img,
             compound="left",
             command=self._start_manual_decryption,
             width=180
@@ -1763,7 +2002,7 @@ class FracturedKeyApp(ctk.CTk):
         ctk.CTkLabel(
             output_header,
             text="Results",
-            image=self._nav_icon_images["manual"]["active"],
+            image=manual_img,
             compound="left",
             font=Fonts.LABEL,
             text_color=Colors.TEXT_PRIMARY
@@ -1781,15 +2020,17 @@ class FracturedKeyApp(ctk.CTk):
         self.manual_output.pack(fill="both", expand=True, padx=24, pady=(0, 24))
         
         # Initial message
-        self.manual_output.insert("1.0", "🔓 Manual decryption mode.\n")
-        self.manual_output.insert("end", "━" * 50 + "\n")
-        self.manual_output.insert("end", "Use this if you saved encrypted data as a .bin file.\n")
+        self.manual_output.insert("1.0", _MANUAL_WELCOME)
         
         return tab
         
     def _create_about_tab(self):
         """Create the about tab"""
-        tab = ctk.CTkScrollableFrame(
+        # Tab icons, looked up once
+        icons = self._active_icons
+        about_img = icons["about"]
+
+        tab = LeanScrollFrame(
             self.content_frame,
             fg_color="transparent",
             scrollbar_button_color=Colors.BG_LIGHT,
@@ -1814,46 +2055,40 @@ class FracturedKeyApp(ctk.CTk):
         overview_card = GlowingCard(content)
         overview_card.pack(fill="x", pady=(0, 20))
         
-        overview_content = ctk.CTkFrame(overview_card, fg_color="transparent")
-        overview_content.pack(fill="x", padx=24, pady=24)
-        
         ctk.CTkLabel(
-            overview_content,
+            overview_card,
             text="What is Fractured Key?",
-            image=self._nav_icon_images["about"]["active"],
+            image=about_img,
             compound="left",
             font=Fonts.TITLE_MD,
             text_color=Colors.TEXT_PRIMARY
-        ).pack(anchor="w", pady=(0, 12))
+        ).pack(anchor="w", padx=24, pady=(24, 12))
         
         overview_text = """Fractured Key is an experimental approach to secure credential storage that avoids traditional single-point vaults. Instead of keeping an encrypted blob in one place, your data is divided, transformed, and distributed across multiple independent carriers.
 
 The result is a system that doesn't resemble a password manager in its raw form — the stored material does not look like secrets at all."""
         
         ctk.CTkLabel(
-            overview_content,
+            overview_card,
             text=overview_text,
             font=Fonts.BODY_MD,
             text_color=Colors.TEXT_SECONDARY,
             wraplength=700,
             justify="left"
-        ).pack(anchor="w")
+        ).pack(anchor="w", padx=24, pady=(0, 24))
         
         # How it works card
         how_card = GlowingCard(content)
         how_card.pack(fill="x", pady=(0, 20))
         
-        how_content = ctk.CTkFrame(how_card, fg_color="transparent")
-        how_content.pack(fill="x", padx=24, pady=24)
-        
         ctk.CTkLabel(
-            how_content,
+            how_card,
             text="How It Works",
-            image=self._nav_icon_images["shuffle"]["active"],
+            image=icons["shuffle"],
             compound="left",
             font=Fonts.TITLE_MD,
             text_color=Colors.TEXT_PRIMARY
-        ).pack(anchor="w", pady=(0, 16))
+        ).pack(anchor="w", padx=24, pady=(24, 16))
         
         steps = [
             ("1", "Your password is encrypted with AES-GCM using a master password"),
@@ -1862,12 +2097,13 @@ The result is a system that doesn't resemble a password manager in its raw form
             ("4", "You need at least 2 out of 3 images to reconstruct your password")
         ]
         
-        for num, text in steps:
-            step_frame = ctk.CTkFrame(how_content, fg_color="transparent")
-            step_frame.pack(fill="x", pady=6)
-            
+        steps_grid = ctk.CTkFrame(how_card, fg_color="transparent")
+        steps_grid.pack(fill="x", padx=24, pady=(0, 24))
+        steps_grid.grid_columnconfigure(1, weight=1)
+        
+        for i, (num, text) in enumerate(steps):
             ctk.CTkLabel(
-                step_frame,
+                steps_grid,
                 text=num,
                 font=Fonts.BODY_MD,
                 text_color=Colors.BG_DARKEST,
@@ -1875,30 +2111,27 @@ The result is a system that doesn't resemble a password manager in its raw form
                 corner_radius=12,
                 width=28,
                 height=28
-            ).pack(side="left", padx=(0, 16))
+            ).grid(row=i, column=0, padx=(0, 16), pady=6)
             
             ctk.CTkLabel(
-                step_frame,
+                steps_grid,
                 text=text,
                 font=Fonts.BODY_MD,
                 text_color=Colors.TEXT_SECONDARY
-            ).pack(side="left")
+            ).grid(row=i, column=1, sticky="w", pady=6)
         
         # Features card
         features_card = GlowingCard(content)
         features_card.pack(fill="x", pady=(0, 20))
         
-        features_content = ctk.CTkFrame(features_card, fg_color="transparent")
-        features_content.pack(fill="x", padx=24, pady=24)
-        
         ctk.CTkLabel(
-            features_content,
+            features_card,
             text="Key Features",
-            image=self._nav_icon_images["shield"]["active"],
+            image=icons["shield"],
             compound="left",
             font=Fonts.TITLE_MD,
             text_color=Colors.TEXT_PRIMARY
-        ).pack(anchor="w", pady=(0, 16))
+        ).pack(anchor="w", padx=24, pady=(24, 16))
         
         features = [
             ("encrypt", "Offline Security", "No reliance on online services"),
@@ -1907,8 +2140,9 @@ The result is a system that doesn't resemble a password manager in its raw form
             ("shield", "Layered Crypto", "Multiple primitives combined for security")
         ]
         
-        features_grid = ctk.CTkFrame(features_content, fg_color="transparent")
-        features_grid.pack(fill="x")
+        features_grid = ctk.CTkFrame(features_card, fg_color="transparent")
+        features_grid.pack(fill="x", padx=24, pady=(0, 24))
+        features_grid.grid_columnconfigure((0, 1), weight=1)
         
         for i, (icon_key, title, desc) in enumerate(features):
             feature_frame = ctk.CTkFrame(
@@ -1917,33 +2151,26 @@ The result is a system that doesn't resemble a password manager in its raw form
                 corner_radius=12
             )
             feature_frame.grid(row=i//2, column=i%2, padx=8, pady=8, sticky="ew")
-            features_grid.grid_columnconfigure(i%2, weight=1)
-            
-            inner = ctk.CTkFrame(feature_frame, fg_color="transparent")
-            inner.pack(fill="x", padx=16, pady=16)
             
-            icon_img = self._nav_icon_images.get(icon_key, {}).get("active") if isinstance(self._nav_icon_images.get(icon_key), dict) else None
-            if icon_img is None:
-                icon_img = self._nav_icon_images.get("about", {}).get("active")
             ctk.CTkLabel(
-                inner,
+                feature_frame,
                 text="",
-                image=icon_img
-            ).pack(anchor="w")
+                image=icons.get(icon_key) or about_img
+            ).pack(anchor="w", padx=16, pady=(16, 0))
             
             ctk.CTkLabel(
-                inner,
+                feature_frame,
                 text=title,
                 font=Fonts.TITLE_SM,
                 text_color=Colors.TEXT_PRIMARY
-            ).pack(anchor="w", pady=(8, 4))
+            ).pack(anchor="w", padx=16, pady=(8, 4))
             
             ctk.CTkLabel(
-                inner,
+                feature_frame,
                 text=desc,
                 font=Fonts.BODY_SM,
                 text_color=Colors.TEXT_MUTED
-            ).pack(anchor="w")
+            ).pack(anchor="w", padx=16, pady=(0, 16))
         
         # Warning card
         warning_card = ctk.CTkFrame(
@@ -1955,11 +2182,8 @@ The result is a system that doesn't resemble a password manager in its raw form
         )
         warning_card.pack(fill="x", pady=(0, 20))
         
-        warning_content = ctk.CTkFrame(warning_card, fg_color="transparent")
-        warning_content.pack(fill="x", padx=24, pady=24)
-        
-        warning_header = ctk.CTkFrame(warning_content, fg_color="transparent")
-        warning_header.pack(fill="x", pady=(0, 8))
+        warning_header = ctk.CTkFrame(warning_card, fg_color="transparent")
+        warning_header.pack(fill="x", padx=24, pady=(24, 8))
         
         ctk.CTkLabel(
             warning_header,
@@ -1976,13 +2200,13 @@ The result is a system that doesn't resemble a password manager in its raw form
         ).pack(side="left")
         
         ctk.CTkLabel(
-            warning_content,
+            warning_card,
             text="This is research-driven software intended for educational and experimental use. Always maintain secure backups of important credentials.",
             font=Fonts.BODY_MD,
             text_color=Colors.TEXT_SECONDARY,
             wraplength=700,
             justify="left"
-        ).pack(anchor="w")
+        ).pack(anchor="w", padx=24, pady=(0, 24))
         
         return tab
         
@@ -2035,55 +2259,54 @@ The result is a system that doesn't resemble a password manager in its raw form
         for tab in self.tabs.values():
             tab.pack_forget()
             
-        # Show selected tab
+        # Show selected tab (building it on first visit)
+        if tab_id not in self.tabs:
+            self.tabs[tab_id] = self._tab_builders[tab_id]()
         self.tabs[tab_id].pack(fill="both", expand=True)
         
         # Update navigation styling (blue accent for active)
         for btn_id, btn_info in self.nav_buttons.items():
             if btn_id == tab_id:
                 btn_info["frame"].configure(fg_color=Colors.BG_LIGHT)
-                btn_info["icon"].configure(image=self._nav_icon_images[btn_id]["active"])
+                btn_info["icon"].configure(image=self._active_icons[btn_id])
                 btn_info["title"].configure(text_color=Colors.ACCENT_PRIMARY)
                 btn_info["subtitle"].configure(text_color=Colors.TEXT_SECONDARY)
             else:
                 btn_info["frame"].configure(fg_color="transparent")
-                btn_info["icon"].configure(image=self._nav_icon_images[btn_id]["muted"])
+                btn_info["icon"].configure(image=self._muted_icons[btn_id])
                 btn_info["title"].configure(text_color=Colors.TEXT_PRIMARY)
                 btn_info["subtitle"].configure(text_color=Colors.TEXT_MUTED)
                 
     def _update_status(self, message, status_type="info"):
         """Update status bar"""
         self.status_var.set(message)
-        
-        if status_type == "success":
-            self.status_indicator.configure(text_color=Colors.SUCCESS)
-        elif status_type == "error":
-            self.status_indicator.configure(text_color=Colors.ERROR)
-        elif status_type == "warning":
-            self.status_indicator.configure(text_color=Colors.WARNING)
-        else:
-            self.status_indicator.configure(text_color=Colors.ACCENT_PRIMARY)
+        self.status_indicator.configure(
+            text_color=_STATUS_COLORS.get(status_type, Colors.ACCENT_PRIMARY)
+        )
             
     def _log_output(self, text_widget, message, msg_type="info"):
-        """Add message to output text widget"""
-        import datetime
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-        
-        # Format based on type
-        prefix = ""
-        if msg_type == "success":
-            prefix = "✓"
-        elif msg_type == "error":
-            prefix = "✗"
-        elif msg_type == "warning":
-            prefix = "⚠"
-        else:
-            prefix = "▸"
-            
+        """Add message to output text widget (safe to call from worker threads)"""
+        timestamp = datetime.now().strftime("%H:%M:%S")
+        prefix = _LOG_PREFIXES.get(msg_type, "▸")
         formatted = f"[{timestamp}] {prefix} {message}\n"
-        text_widget.insert("end", formatted)
-        text_widget.see("end")
-        self.update_idletasks()
+        self._log_queue.put((text_widget, formatted))
+
+    def _drain_log_queue(self):
+        """Write all queued log lines: one insert + one see per widget (Tk thread only)"""
+        pending = {}
+        while True:
+            try:
+                text_widget, formatted = self._log_queue.get_nowait()
+            except queue.Empty:
+                break
+            pending.setdefault(text_widget, []).append(formatted)
+        try:
+            for text_widget, lines in pending.items():
+                text_widget.insert("end", "".join(lines))
+                text_widget.see("end")
+        finally:
+            # Re-schedule even if a widget has gone away, so the pump never stops
+            self.after(33, self._drain_log_queue)
         
     # ═══════════════════════════════════════════════════════════════════════════
     # ENCRYPTION LOGIC
@@ -2110,19 +2333,25 @@ The result is a system that doesn't resemble a password manager in its raw form
         self.encrypt_btn.configure(state="disabled")
         self._update_status("Encrypting...", "info")
         
-        # Run in thread
+        # Run in thread (Tk variables are read here, not from the worker)
         thread = threading.Thread(
             target=self._encrypt_worker,
-            args=(password, master_password)
+            args=(password, master_password, self.use_shares_var.get(), self.debug_var.get())
         )
         thread.daemon = True
         thread.start()
         
-    def _encrypt_worker(self, password, master_password):
+    def _toggle_debug_output(self, event=None):
+        """Flip the hidden encryption debug dump"""
+        enabled = not self.debug_var.get()
+        self.debug_var.set(enabled)
+        self._update_status(f"Debug output {'enabled' if enabled else 'disabled'}", "warning" if enabled else "info")
+        
+    def _encrypt_worker(self, password, master_password, use_shares, debug=False):
         """Encryption worker thread"""
         try:
             self._log_output(self.encrypt_output, "Starting encryption process...", "info")
-            self._log_output(self.encrypt_output, "━" * 50, "info")
+            self._log_output(self.encrypt_output, _SEPARATOR, "info")
             
             # Encrypt the password
             self._log_output(self.encrypt_output, f"Password length: {len(password)} characters", "info")
@@ -2130,21 +2359,22 @@ The result is a system that doesn't resemble a password manager in its raw form
             
             salt, nonce, ciphertext_with_tag = encrypt_password_aes_gcm(password, master_password)
             
-            import base64
-            ciphertext = ciphertext_with_tag[:-16]
-            auth_tag = ciphertext_with_tag[-16:]
-            
             self._log_output(self.encrypt_output, "Encryption successful!", "success")
-            self._log_output(self.encrypt_output, "━" * 50, "info")
-            self._log_output(self.encrypt_output, f"Salt: {base64.b64encode(salt).decode()}", "info")
-            self._log_output(self.encrypt_output, f"Nonce: {base64.b64encode(nonce).decode()}", "info")
-            self._log_output(self.encrypt_output, f"Ciphertext: {base64.b64encode(ciphertext).decode()}", "info")
-            self._log_output(self.encrypt_output, f"Auth Tag: {base64.b64encode(auth_tag).decode()}", "info")
             
-            binary_blob = salt + nonce + ciphertext_with_tag
+            if debug:
+                import base64
+                mv = memoryview(ciphertext_with_tag)
+                ciphertext, auth_tag = mv[:-16], mv[-16:]
+                self._log_output(self.encrypt_output, _SEPARATOR, "info")
+                self._log_output(self.encrypt_output, f"Salt: {base64.b64encode(salt).decode()}", "info")
+                self._log_output(self.encrypt_output, f"Nonce: {base64.b64encode(nonce).decode()}", "info")
+                self._log_output(self.encrypt_output, f"Ciphertext: {base64.b64encode(ciphertext).decode()}", "info")
+                self._log_output(self.encrypt_output, f"Auth Tag: {base64.b64encode(auth_tag).decode()}", "info")
+            
+            binary_blob = b"".join((salt, nonce, ciphertext_with_tag))
             
-            if self.use_shares_var.get():
-                self._log_output(self.encrypt_output, "━" * 50, "info")
+            if use_shares:
+                self._log_output(self.encrypt_output, _SEPARATOR, "info")
                 self._log_output(self.encrypt_output, "Splitting into SSS shares...", "info")
                 self._create_shares_and_embed(binary_blob)
             else:
@@ -2167,8 +2397,6 @@ The result is a system that doesn't resemble a password manager in its raw form
     def _create_shares_and_embed(self, binary_blob):
         """Create shares and embed into images"""
         try:
-            from cryptography.hazmat.primitives.ciphers.aead import AESGCM
-            
             self._log_output(self.encrypt_output, "Generating ephemeral key...", "info")
             K2 = os.urandom(16)
             aes = AESGCM(K2)
@@ -2181,47 +2409,71 @@ The result is a system that doesn't resemble a password manager in its raw form
             self._log_output(self.encrypt_output, f"Splitting key into {n_shares} shares (threshold: {threshold})...", "info")
             shares = split_bytes_into_shares(K2, n=n_shares, k=threshold)
             
-            for i, share_bytes in enumerate(shares, start=1):
-                self._log_output(self.encrypt_output, f"━" * 50, "info")
-                self._log_output(self.encrypt_output, f"Processing share {i}/{n_shares}...", "info")
-                
-                file_types = [("Images", "*.png *.jpg *.jpeg *.bmp *.tiff"), ("All files", "*.*")]
-                carrier_path = native_file_dialog(
-                    self,
-                    title=f"Select carrier image for share {i}",
-                    filetypes=file_types,
-                    mode="open",
-                    initialdir=os.path.expanduser("~/Pictures")
-                )
-                
-                if not carrier_path:
-                    self._log_output(self.encrypt_output, f"No carrier selected for share {i}. Skipping.", "warning")
-                    continue
-                    
-                self._log_output(self.encrypt_output, f"Carrier: {os.path.basename(carrier_path)}", "info")
-                
-                payload = self._wrap_share_payload(share_bytes, index=i, total=n_shares,
-                                                   threshold=threshold, packaged_cipher=packaged_cipher)
-                
-                output_path = native_file_dialog(
-                    self,
-                    title=f"Save stego image for share {i}",
-                    filetypes=[("PNG image", "*.png"), ("All files", "*.*")],
-                    mode="save",
-                    initialdir=os.path.expanduser("~/Pictures"),
-                    defaultextension=".png"
-                )
-                
-                if not output_path:
-                    base = os.path.splitext(carrier_path)[0]
-                    output_path = f"{base}_stego_{i}.png"
-                    
-                saved_path = embed_data_into_image(carrier_path, payload, output_path=output_path)
-                self._log_output(self.encrypt_output, f"Share {i} embedded: {saved_path}", "success")
+            # Embedding runs in the background while the next share's dialogs are open
+            pending = []
+            try:
+                with ThreadPoolExecutor(max_workers=2) as embed_pool:
+                    for i, share_bytes in enumerate(shares, start=1):
+                        self._log_output(self.encrypt_output, _SEPARATOR, "info")
+                        self._log_output(self.encrypt_output, f"Processing share {i}/{n_shares}...", "info")
+                        
+                        file_types = [("Images", "*.png *.jpg *.jpeg *.bmp *.tiff"), ("All files", "*.*")]
+                        carrier_path = native_file_dialog(
+                            self,
+                            title=f"Select carrier image for share {i}",
+                            filetypes=file_types,
+                            mode="open",
+                            initialdir=_PICTURES
+                        )
+                        
+                        if not carrier_path:
+                            self._log_output(self.encrypt_output, f"No carrier selected for share {i}. Skipping.", "warning")
+                            continue
+                        
+                        self._log_output(self.encrypt_output, f"Carrier: {os.path.basename(carrier_path)}", "info")
+                        
+                        payload = self._wrap_share_payload(share_bytes, index=i, total=n_shares,
+                                                           threshold=threshold, packaged_cipher=packaged_cipher)
+                        
+                        output_path = native_file_dialog(
+                            self,
+                            title=f"Save stego image for share {i}",
+                            filetypes=[("PNG image", "*.png"), ("All files", "*.*")],
+                            mode="save",
+                            initialdir=_PICTURES,
+                            defaultextension=".png"
+                        )
+                        
+                        if not output_path:
+                            base = os.path.splitext(carrier_path)[0]
+                            output_path = f"{base}_stego_{i}.png"
+                        
+                        self._log_output(self.encrypt_output, f"Embedding share {i}...", "info")
+                        pending.append((i, embed_pool.submit(
+                            embed_data_into_image, carrier_path, payload, output_path=output_path
+                        )))
+            finally:
+                # Leaving the with-block waited for every started embed; report them all,
+                # even when a later dialog or payload step raised
+                failed = 0
+                for i, future in pending:
+                    try:
+                        saved_path = future.result()
+                    except Exception as e:
+                        failed += 1
+                        self._log_output(self.encrypt_output, f"Share {i} embedding failed: {str(e)}", "error")
+                    else:
+                        self._log_output(self.encrypt_output, f"Share {i} embedded: {saved_path}", "success")
                 
-            self._log_output(self.encrypt_output, "━" * 50, "info")
-            self._log_output(self.encrypt_output, "All shares processed successfully!", "success")
-            self._log_output(self.encrypt_output, "Keep at least 2 stego images safe!", "warning")
+            self._log_output(self.encrypt_output, _SEPARATOR, "info")
+            if not pending:
+                self._log_output(self.encrypt_output, "No shares were embedded (no carrier images selected).", "error")
+            else:
+                if failed:
+                    self._log_output(self.encrypt_output, f"{failed} share(s) could not be embedded.", "error")
+                else:
+                    self._log_output(self.encrypt_output, "All shares processed successfully!", "success")
+                self._log_output(self.encrypt_output, "Keep at least 2 stego images safe!", "warning")
             
         except Exception as e:
             self._log_output(self.encrypt_output, f"Share creation failed: {str(e)}", "error")
@@ -2231,15 +2483,16 @@ The result is a system that doesn't resemble a password manager in its raw form
         SHARE_MAGIC = b"FKSS01"
         SHARE_VERSION = 1
         
-        header = bytearray()
-        header += SHARE_MAGIC
-        header.append(SHARE_VERSION & 0xFF)
-        header.append(index & 0xFF)
-        header.append(total & 0xFF)
-        header.append(threshold & 0xFF)
-        header += len(share_bytes).to_bytes(4, 'big')
-        header += len(packaged_cipher).to_bytes(4, 'big')
-        return bytes(header) + share_bytes + packaged_cipher
+        header = _SHARE_HDR.pack(
+            SHARE_MAGIC,
+            SHARE_VERSION & 0xFF,
+            index & 0xFF,
+            total & 0xFF,
+            threshold & 0xFF,
+            len(share_bytes),
+            len(packaged_cipher),
+        )
+        return header + share_bytes + packaged_cipher
         
     def _encryption_finished(self):
         """Called when encryption is finished — clear passwords so they are not shown."""
@@ -2261,7 +2514,7 @@ The result is a system that doesn't resemble a password manager in its raw form
             title="Select stego image",
             filetypes=file_types,
             mode="open",
-            initialdir=os.path.expanduser("~/Pictures")
+            initialdir=_PICTURES
         )
         
         if file_path and file_path not in self.selected_images:
@@ -2279,10 +2532,11 @@ The result is a system that doesn't resemble a password manager in its raw form
         self.image_listbox.delete("1.0", "end")
         
         if not self.selected_images:
-            self.image_listbox.insert("1.0", "No images selected.\n")
+            text = "No images selected.\n"
         else:
-            for i, path in enumerate(self.selected_images, 1):
-                self.image_listbox.insert("end", f"{i}. {os.path.basename(path)}\n")
+            basename = os.path.basename
+            text = "".join(f"{i}. {basename(path)}\n" for i, path in enumerate(self.selected_images, 1))
+        self.image_listbox.insert("1.0", text)
                 
         self.image_listbox.configure(state="disabled")
         
@@ -2304,7 +2558,7 @@ The result is a system that doesn't resemble a password manager in its raw form
         
         thread = threading.Thread(
             target=self._decrypt_worker,
-            args=(self.selected_images.copy(), master_password)
+            args=(tuple(self.selected_images), master_password)
         )
         thread.daemon = True
         thread.start()
@@ -2313,7 +2567,7 @@ The result is a system that doesn't resemble a password manager in its raw form
         """Decryption worker thread"""
         try:
             self._log_output(self.decrypt_output, "Starting decryption process...", "info")
-            self._log_output(self.decrypt_output, "━" * 50, "info")
+            self._log_output(self.decrypt_output, _SEPARATOR, "info")
             self._log_output(self.decrypt_output, f"Processing {len(image_paths)} stego images...", "info")
             
             parsed_shares = []
@@ -2328,49 +2582,47 @@ The result is a system that doesn't resemble a password manager in its raw form
                 self._log_output(self.decrypt_output, "Not enough valid shares found", "error")
                 return
                 
-            # Validate compatibility
-            vs = {s['version'] for s in parsed_shares}
-            totals = {s['total'] for s in parsed_shares}
-            thresholds = {s['threshold'] for s in parsed_shares}
-            pkg_hashes = {s['packaged_cipher'] for s in parsed_shares}
-            
-            if len(vs) != 1 or len(totals) != 1 or len(thresholds) != 1 or len(pkg_hashes) != 1:
-                self._log_output(self.decrypt_output, "Selected shares do not match!", "error")
-                return
+            # Validate compatibility (stops at the first share that differs)
+            first = parsed_shares[0]
+            for s in parsed_shares[1:]:
+                if (s['version'] != first['version'] or s['total'] != first['total']
+                        or s['threshold'] != first['threshold']
+                        or s['packaged_cipher'] != first['packaged_cipher']):
+                    self._log_output(self.decrypt_output, "Selected shares do not match!", "error")
+                    return
                 
             threshold = parsed_shares[0]['threshold']
             if len(parsed_shares) < threshold:
                 self._log_output(self.decrypt_output, f"Need at least {threshold} shares", "error")
                 return
                 
-            self._log_output(self.decrypt_output, "━" * 50, "info")
+            self._log_output(self.decrypt_output, _SEPARATOR, "info")
             self._log_output(self.decrypt_output, "Recovering ephemeral key...", "info")
             
-            share_bytes_list = [s['share_bytes'] for s in parsed_shares[:threshold]]
+            share_bytes_list = [bytes(s['share_bytes']) for s in parsed_shares[:threshold]]
             packaged_cipher = parsed_shares[0]['packaged_cipher']
             
             recovered_k2 = recover_bytes_from_shares(share_bytes_list)
             if len(recovered_k2) < 16:
-                recovered_k2 = (b'\x00' * (16 - len(recovered_k2))) + recovered_k2
+                recovered_k2 = recovered_k2.rjust(16, b'\x00')
             elif len(recovered_k2) > 16:
                 recovered_k2 = recovered_k2[-16:]
                 
-            from cryptography.hazmat.primitives.ciphers.aead import AESGCM
             aes = AESGCM(recovered_k2)
             nonce2 = packaged_cipher[:12]
             ct_and_tag = packaged_cipher[12:]
-            binary_blob = aes.decrypt(nonce2, ct_and_tag, None)
+            binary_blob = memoryview(aes.decrypt(nonce2, ct_and_tag, None))
             
-            salt = binary_blob[:16]
+            salt = bytes(binary_blob[:16])  # argon2-cffi needs real bytes
             nonce = binary_blob[16:28]
             ciphertext_with_tag = binary_blob[28:]
             
             self._log_output(self.decrypt_output, "Decrypting with master password...", "info")
             plaintext = decrypt_password_aes_gcm(salt, nonce, ciphertext_with_tag, master_password)
             
-            self._log_output(self.decrypt_output, "━" * 50, "info")
+            self._log_output(self.decrypt_output, _SEPARATOR, "info")
             self._log_output(self.decrypt_output, "DECRYPTION SUCCESSFUL!", "success")
-            self._log_output(self.decrypt_output, "━" * 50, "info")
+            self._log_output(self.decrypt_output, _SEPARATOR, "info")
             self._log_output(self.decrypt_output, f"🔑 Password: {plaintext}", "success")
             self._log_output(self.decrypt_output, f"Length: {len(plaintext)} characters", "info")
             
@@ -2380,29 +2632,26 @@ The result is a system that doesn't resemble a password manager in its raw form
             self.after(0, self._decryption_finished)
             
     def _parse_share_payload(self, payload):
-        """Parse wrapped share payload"""
+        """Parse wrapped share payload (share_bytes / packaged_cipher come back as views into it)"""
         SHARE_MAGIC = b"FKSS01"
-        SHARE_MAGIC_LEN = len(SHARE_MAGIC)
         
-        min_header = SHARE_MAGIC_LEN + 1 + 1 + 1 + 1 + 4 + 4
-        if len(payload) < min_header:
+        try:
+            (magic, version, index, total, threshold,
+             share_len, packaged_cipher_len) = _SHARE_HDR.unpack_from(payload, 0)
+        except struct.error:
             raise ValueError("Share payload too short")
-        if payload[:SHARE_MAGIC_LEN] != SHARE_MAGIC:
+        if magic != SHARE_MAGIC:
             raise ValueError("Share magic mismatch")
             
-        pos = SHARE_MAGIC_LEN
-        version = payload[pos]; pos += 1
-        index = payload[pos]; pos += 1
-        total = payload[pos]; pos += 1
-        threshold = payload[pos]; pos += 1
-        share_len = int.from_bytes(payload[pos:pos+4], 'big'); pos += 4
-        packaged_cipher_len = int.from_bytes(payload[pos:pos+4], 'big'); pos += 4
-        
-        if pos + share_len + packaged_cipher_len > len(payload):
+        # One bounds check against the final end offset covers both sections
+        share_end = _SHARE_HDR.size + share_len
+        end = share_end + packaged_cipher_len
+        if end > len(payload):
             raise ValueError("Declared sizes exceed payload size")
             
-        share_bytes = payload[pos:pos+share_len]; pos += share_len
-        packaged_cipher = payload[pos:pos+packaged_cipher_len]
+        view = memoryview(payload)
+        share_bytes = view[_SHARE_HDR.size:share_end]
+        packaged_cipher = view[share_end:end]
         
         return {
             "version": version,
@@ -2435,7 +2684,7 @@ The result is a system that doesn't resemble a password manager in its raw form
             title="Select .bin file for decryption",
             filetypes=[("Binary files", "*.bin"), ("All files", "*.*")],
             mode="open",
-            initialdir=os.path.expanduser("~/Downloads")
+            initialdir=_DOWNLOADS
         )
         if file_path:
             self.manual_file_entry.delete(0, "end")
@@ -2455,14 +2704,19 @@ The result is a system that doesn't resemble a password manager in its raw form
             return
             
         self.manual_output.delete("1.0", "end")
+        mm = None
         
         try:
             self._log_output(self.manual_output, "Starting manual decryption...", "info")
-            self._log_output(self.manual_output, "━" * 50, "info")
+            self._log_output(self.manual_output, _SEPARATOR, "info")
             self._log_output(self.manual_output, f"File: {os.path.basename(file_path)}", "info")
             
             with open(file_path, "rb") as f:
-                binary_blob = f.read()
+                if os.fstat(f.fileno()).st_size > _MMAP_THRESHOLD:
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    binary_blob = memoryview(mm)
+                else:
+                    binary_blob = memoryview(f.read())
                 
             self._log_output(self.manual_output, f"File size: {len(binary_blob)} bytes", "info")
                 
@@ -2470,16 +2724,16 @@ The result is a system that doesn't resemble a password manager in its raw form
                 self._log_output(self.manual_output, "File too small to be valid", "error")
                 return
                 
-            salt = binary_blob[:16]
+            salt = bytes(binary_blob[:16])  # argon2-cffi needs real bytes
             nonce = binary_blob[16:28]
             ciphertext_with_tag = binary_blob[28:]
             
             self._log_output(self.manual_output, "Decrypting with master password...", "info")
             plaintext = decrypt_password_aes_gcm(salt, nonce, ciphertext_with_tag, master_password)
             
-            self._log_output(self.manual_output, "━" * 50, "info")
+            self._log_output(self.manual_output, _SEPARATOR, "info")
             self._log_output(self.manual_output, "DECRYPTION SUCCESSFUL!", "success")
-            self._log_output(self.manual_output, "━" * 50, "info")
+            self._log_output(self.manual_output, _SEPARATOR, "info")
             self._log_output(self.manual_output, f"🔑 Password: {plaintext}", "success")
             self._log_output(self.manual_output, f"Length: {len(plaintext)} characters", "info")
             
@@ -2489,6 +2743,10 @@ The result is a system that doesn't resemble a password manager in its raw form
             self._log_output(self.manual_output, f"Manual decryption failed: {str(e)}", "error")
             self._update_status("Manual decryption failed", "error")
         finally:
+            # Drop every view into the map first; mmap refuses to close while exported
+            binary_blob = nonce = ciphertext_with_tag = None
+            if mm is not None:
+                mm.close()
             # Clear file path and password so they are not left visible
             self.manual_file_entry.delete(0, "end")
             self.manual_master_entry.delete(0, "end")
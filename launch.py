@@ -7,24 +7,55 @@ Automatically checks and installs requirements before launching the application
 import sys
 import os
 import subprocess
+import importlib.util
+import hashlib
+from functools import lru_cache
+
+# Directory holding this script, requirements.txt and setup.py
+_HERE = os.path.dirname(os.path.abspath(__file__))
+# Holds a digest of requirements.txt + interpreter once every package was found
+_DEPS_MARKER = os.path.join(_HERE, ".deps_ok")
+
+@lru_cache(maxsize=1)
+def _parse_requirements(path):
+    """Return the lower-cased package names listed in a requirements file"""
+    required_packages = []
+    with open(path, 'r') as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith('#'):
+                # Extract package name (before >=, ==, etc.)
+                package_name = line.split('>=')[0].split('==')[0].split(' ')[0]
+                required_packages.append(package_name.lower())
+    return tuple(required_packages)
+
+def _requirements_digest(path):
+    """Digest of the requirements file and the interpreter it was checked against"""
+    h = hashlib.blake2b(digest_size=8)
+    with open(path, 'rb') as f:
+        h.update(f.read())
+    h.update(sys.executable.encode())
+    return h.hexdigest()
 
 def check_and_install_requirements():
     """Check if requirements are installed, install if missing"""
-    requirements_file = os.path.join(os.path.dirname(__file__), "requirements.txt")
+    requirements_file = os.path.join(_HERE, "requirements.txt")
     
     if not os.path.exists(requirements_file):
         print("ERROR: requirements.txt not found!")
         return False
     
+    # Warm launch: nothing changed since every package was last found
+    digest = _requirements_digest(requirements_file)
+    try:
+        with open(_DEPS_MARKER, 'r') as f:
+            if f.read().strip() == digest:
+                return True
+    except OSError:
+        pass
+    
     # Read required packages
-    required_packages = []
-    with open(requirements_file, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if line and not line.startswith('#'):
-                # Extract package name (before >=, ==, etc.)
-                package_name = line.split('>=')[0].split('==')[0].split(' ')[0]
-                required_packages.append(package_name.lower())
+    required_packages = _parse_requirements(requirements_file)
     
     # Map package names to import names
     import_map = {
@@ -39,12 +70,10 @@ def check_and_install_requirements():
     
     missing_packages = []
     
-    # Check each package
+    # Check each package (find_spec locates it without importing it)
     for package in required_packages:
         import_name = import_map.get(package, package)
-        try:
-            __import__(import_name)
-        except ImportError:
+        if importlib.util.find_spec(import_name) is None:
             missing_packages.append(package)
     
     # If packages are missing, run setup
@@ -57,7 +86,7 @@ def check_and_install_requirements():
         print("=" * 70 + "\n")
         
         # Run setup.py
-        setup_script = os.path.join(os.path.dirname(__file__), "setup.py")
+        setup_script = os.path.join(_HERE, "setup.py")
         if os.path.exists(setup_script):
             result = subprocess.run([sys.executable, setup_script], 
                                   capture_output=False)
@@ -72,13 +101,34 @@ def check_and_install_requirements():
             if result.returncode != 0:
                 print("\nERROR: Failed to install requirements.")
                 return False
+    else:
+        try:
+            with open(_DEPS_MARKER, 'w') as f:
+                f.write(digest)
+        except OSError:
+            pass  # read-only install: just re-check next launch
     
     return True
 
 def launch_gui():
     """Launch the GUI application"""
     try:
-        from fractured_gui import main
+        try:
+            from fractured_gui import main
+        except ImportError:
+            # The .deps_ok marker can outlive a package removed since the last check:
+            # drop it, re-run the dependency check and retry the import once
+            if not os.path.exists(_DEPS_MARKER):
+                raise
+            try:
+                os.remove(_DEPS_MARKER)
+            except OSError:
+                pass
+            print("GUI dependencies changed since the last check; re-checking requirements...")
+            if not check_and_install_requirements():
+                raise
+            importlib.invalidate_caches()
+            from fractured_gui import main
         main()
     except ImportError as e:
         print(f"ERROR: Could not import GUI module: {e}")
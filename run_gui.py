@@ -6,20 +6,20 @@ Run this file to start the modern GUI application
 
 import sys
 import os
+import importlib
+import importlib.util
 
 # Add current directory to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-# Check for customtkinter
-try:
-    import customtkinter
-except ImportError:
+# Check for customtkinter (find_spec locates it without importing it)
+if importlib.util.find_spec("customtkinter") is None:
     print("=" * 60)
     print("CustomTkinter not found. Installing...")
     print("=" * 60)
     import subprocess
     subprocess.check_call([sys.executable, "-m", "pip", "install", "customtkinter"])
-    import customtkinter
+    importlib.invalidate_caches()
 
 # Launch the application
 from fractured_gui import main
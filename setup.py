@@ -13,6 +13,9 @@ import subprocess
 import os
 import platform
 import shutil
+import importlib
+import importlib.util
+import importlib.metadata
 
 # Fix Windows console encoding issues
 if sys.platform == 'win32':
@@ -23,6 +26,14 @@ if sys.platform == 'win32':
     except:
         pass
 
+# Directory holding this script and requirements.txt
+_HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Every pip install runs non-interactively and skips the self-version probe
+PIP_INSTALL = [sys.executable, "-m", "pip", "install", "--no-input", "--disable-pip-version-check"]
+# upgrade_pip leaves pip alone at or above this version unless --upgrade-pip is given
+PIP_FLOOR = (23, 0)
+
 def print_header(text):
     """Print a formatted header"""
     print("\n" + "=" * 70)
@@ -75,7 +86,7 @@ def install_pip():
         
         # Download get-pip.py
         get_pip_url = "https://bootstrap.pypa.io/get-pip.py"
-        get_pip_path = os.path.join(os.path.dirname(__file__), "get-pip.py")
+        get_pip_path = os.path.join(_HERE, "get-pip.py")
         
         urllib.request.urlretrieve(get_pip_url, get_pip_path)
         print_status("Installing pip...", "INFO")
@@ -101,11 +112,22 @@ def install_pip():
         print_status("Please install pip manually: https://pip.pypa.io/en/stable/installation/", "WARNING")
         return False
 
-def upgrade_pip():
-    """Upgrade pip to the latest version"""
+def upgrade_pip(force=False):
+    """Upgrade pip to the latest version (skipped when it already meets PIP_FLOOR)"""
+    if not force:
+        try:
+            current = importlib.metadata.version("pip")
+            # Compare the leading numeric release only; packaging may not be installed yet
+            release = tuple(int(part) for part in current.split(".")[:2] if part.isdigit())
+        except importlib.metadata.PackageNotFoundError:
+            release = ()
+        if release >= PIP_FLOOR:
+            print_status(f"pip {current} is recent enough, skipping upgrade", "SUCCESS")
+            return True
+    
     print_status("Upgrading pip to latest version...", "INFO")
     try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "--upgrade", "pip"],
+        subprocess.check_call(PIP_INSTALL + ["--upgrade", "pip"],
                             stdout=subprocess.DEVNULL,
                             stderr=subprocess.DEVNULL)
         print_status("pip upgraded successfully", "SUCCESS")
@@ -116,7 +138,7 @@ def upgrade_pip():
 
 def install_requirements():
     """Install all packages from requirements.txt"""
-    requirements_file = os.path.join(os.path.dirname(__file__), "requirements.txt")
+    requirements_file = os.path.join(_HERE, "requirements.txt")
     
     if not os.path.exists(requirements_file):
         print_status(f"requirements.txt not found at {requirements_file}", "ERROR")
@@ -131,7 +153,7 @@ def install_requirements():
     try:
         # Install requirements with verbose output
         result = subprocess.run(
-            [sys.executable, "-m", "pip", "install"] + install_flags,
+            PIP_INSTALL + install_flags,
             capture_output=True,
             text=True,
             check=False
@@ -146,7 +168,7 @@ def install_requirements():
                 print_status("User installation failed, trying system-wide...", "WARNING")
                 install_flags.remove("--user")
                 result = subprocess.run(
-                    [sys.executable, "-m", "pip", "install"] + install_flags,
+                    PIP_INSTALL + install_flags,
                     capture_output=True,
                     text=True,
                     check=False
@@ -167,20 +189,46 @@ def install_requirements():
         print_status(f"Error installing requirements: {str(e)}", "ERROR")
         return False
 
+def _requirement_satisfied(requirement):
+    """True if an installed distribution already meets the requirement line's version specifier"""
+    try:
+        from packaging.requirements import Requirement
+    except ImportError:
+        return False  # cannot compare versions yet; let pip decide
+    try:
+        req = Requirement(requirement)
+        installed = importlib.metadata.version(req.name)
+    except (ValueError, importlib.metadata.PackageNotFoundError):
+        return False
+    return req.specifier.contains(installed, prereleases=True)
+
 def install_requirements_individually(requirements_file):
-    """Install requirements one by one for better error reporting"""
+    """Install requirements one by one for better error reporting.
+
+    Only called after the single ``pip install -r`` batch has failed, so
+    lines whose installed version already satisfies the specifier are
+    skipped and pip is started once per remaining package rather than
+    once per requirement line.
+    """
     failed_packages = []
     
     with open(requirements_file, 'r') as f:
         packages = [line.strip() for line in f if line.strip() and not line.strip().startswith('#')]
     
+    remaining = []
+    for package in packages:
+        if _requirement_satisfied(package):
+            print_status(f"{package} already satisfied", "SUCCESS")
+        else:
+            remaining.append(package)
+    
     # Try with --user flag first
     use_user_flag = True
     
-    for package in packages:
+    for package in remaining:
         print_status(f"Installing {package}...", "INFO")
         try:
-            install_cmd = [sys.executable, "-m", "pip", "install", package, "--upgrade"]
+            install_cmd = PIP_INSTALL + [package, "--upgrade"]
             if use_user_flag:
                 install_cmd.append("--user")
             
@@ -195,7 +243,7 @@ def install_requirements_individually(requirements_file):
             if use_user_flag:
                 try:
                     subprocess.check_call(
-                        [sys.executable, "-m", "pip", "install", package, "--upgrade"],
+                        PIP_INSTALL + [package, "--upgrade"],
                         stdout=subprocess.DEVNULL,
                         stderr=subprocess.DEVNULL
                     )
@@ -230,18 +278,14 @@ def verify_installation():
     
     missing_packages = []
     
+    # Packages were just installed by this process; drop stale finder caches
+    importlib.invalidate_caches()
+    
     for package in critical_packages:
-        try:
-            if package == "Crypto":
-                __import__("Crypto")
-            elif package == "PIL":
-                __import__("PIL")
-            elif package == "argon2_cffi":
-                __import__("argon2")
-            else:
-                __import__(package)
+        import_name = "argon2" if package == "argon2_cffi" else package
+        if importlib.util.find_spec(import_name) is not None:
             print_status(f"{package} - OK", "SUCCESS")
-        except ImportError:
+        else:
             print_status(f"{package} - MISSING", "ERROR")
             missing_packages.append(package)
     
@@ -254,6 +298,13 @@ def verify_installation():
 
 def main():
     """Main setup function"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Fractured Keys Setup')
+    parser.add_argument('--upgrade-pip', action='store_true',
+                        help='Upgrade pip even if it is already recent')
+    args = parser.parse_args()
+    
     print_header("Fractured Keys - Automated Setup")
     
     # Check Python
@@ -266,7 +317,7 @@ def main():
         sys.exit(1)
     
     # Upgrade pip
-    upgrade_pip()
+    upgrade_pip(force=args.upgrade_pip)
     
     # Install requirements
     if not install_requirements():
@@ -143,6 +143,83 @@ def test_steganography():
         print(f"❌ Steganography test failed: {e}")
         return False
 
+def test_share_payload():
+    """Test share payload wrapping/parsing and rejection of malformed payloads"""
+    print("\n📦 Testing share payload format...")
+    
+    try:
+        from encryption import _wrap_share_payload
+        from decryption import _parse_share_payload
+        
+        share_bytes = b"\x01" + b"share-bytes-0123"
+        packaged_cipher = b"salt" * 4 + b"nonce-12byte" + b"ciphertext+tag"
+        
+        # Round trip
+        payload = _wrap_share_payload(share_bytes, index=2, total=3, threshold=2,
+                                      packaged_cipher=packaged_cipher)
+        meta = _parse_share_payload(payload)
+        if (meta["index"], meta["total"], meta["threshold"]) != (2, 3, 2):
+            print("❌ Share metadata mismatch")
+            return False
+        if bytes(meta["share_bytes"]) != share_bytes or bytes(meta["packaged_cipher"]) != packaged_cipher:
+            print("❌ Share sections mismatch")
+            return False
+        print("✅ Payload round trip successful")
+        
+        # Truncated payloads (inside the header and inside the data) must be rejected
+        for cut in (4, len(payload) - 1):
+            try:
+                _parse_share_payload(payload[:cut])
+            except ValueError:
+                continue
+            print(f"❌ Truncated payload ({cut} bytes) was accepted")
+            return False
+        print("✅ Truncated payloads rejected")
+        
+        # Bad magic must be rejected
+        try:
+            _parse_share_payload(b"XXXXXX" + payload[6:])
+        except ValueError:
+            print("✅ Bad magic rejected")
+            return True
+        print("❌ Payload with bad magic was accepted")
+        return False
+        
+    except Exception as e:
+        print(f"❌ Share payload test failed: {e}")
+        return False
+
+def test_requirement_check():
+    """Test setup.py's installed-version check against requirement pins"""
+    print("\n📋 Testing requirement version check...")
+    
+    try:
+        import importlib.metadata
+        from setup import _requirement_satisfied
+        
+        pillow_version = importlib.metadata.version("Pillow")
+        
+        if not _requirement_satisfied(f"Pillow=={pillow_version}"):
+            print("❌ Satisfied pin reported as unsatisfied")
+            return False
+        print("✅ Satisfied pin accepted")
+        
+        if _requirement_satisfied("Pillow>=99999"):
+            print("❌ Unsatisfied pin reported as satisfied")
+            return False
+        print("✅ Unsatisfied pin rejected")
+        
+        if _requirement_satisfied("fractured-keys-no-such-package>=1.0"):
+            print("❌ Missing package reported as satisfied")
+            return False
+        print("✅ Missing package rejected")
+        
+        return True
+        
+    except Exception as e:
+        print(f"❌ Requirement check test failed: {e}")
+        return False
+
 def main():
     """Run all tests"""
     print("🧪 Fractured Keys - Basic Functionality Test")
@@ -152,7 +229,9 @@ def main():
         test_imports,
         test_crypto,
         test_sss,
-        test_steganography
+        test_steganography,
+        test_share_payload,
+        test_requirement_check
     ]
     
     passed = 0